@@ -17,10 +17,11 @@ def test_list_devices():
     devices = device_list()
     print(f"找到 {len(devices)} 个设备:")
     for dev in devices:
-        print(f"  - 索引: {dev['index']}")
-        print(f"    类型: {dev['type']}")
-        print(f"    型号: {dev['model_name']}")
-        print(f"    IP: {dev['ip_address']}")
+        print(f"  - 索引: {dev.index}")
+        print(f"    类型: {dev.type}")
+        print(f"    型号: {dev.model_name}")
+        print(f"    序列号: {dev.serial_number}")
+        print(f"    IP: {dev.ip_address}")
         print()
     return devices
 
@@ -141,10 +142,20 @@ def test_continuous_capture():
             print("开始连续采集 5 帧...")
 
             import cv2
+            from concurrent.futures import ThreadPoolExecutor
+
+            # JPEG 编码放到线程池中，采集循环不被磁盘写入阻塞
+            # get_image 返回的是独立副本，可以直接交给其他线程
+            pool = ThreadPoolExecutor(max_workers=2)
+            futures = []
             for i in range(5):
                 image = camera.get_image()
                 print(f"  帧 {i+1}: 形状 {image.shape}")
-                cv2.imwrite(f"frame_{i+1}.jpg", image)
+                futures.append(pool.submit(cv2.imwrite, f"frame_{i+1}.jpg", image))
+
+            pool.shutdown(wait=True)
+            for future in futures:
+                future.result()
 
             camera.stop()
             print("连续采集测试通过!")
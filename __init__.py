@@ -11,24 +11,40 @@ Example:
     ...     print(f"图像形状: {image.shape}")
 """
 
-from .hikcamera import (
-    HikCamera,
-    HikCameraError,
-    device_list,
-)
-from .config import HikCameraConfig, CameraParams
+from .config import HikCameraConfig, CameraParams, DeviceInfo
 from .utils import (
     enumerate_devices,
+    invalidate_device_cache,
+    DEVICE_TYPES_ALL,
+    DEVICE_TYPES_USB,
+    DEVICE_TYPES_GIGE,
     decoding_char,
 )
 
+# 导入 hikcamera 模块会加载 SDK 动态库，相关名称在第一次访问时再导入
+_LAZY_NAMES = ('HikCamera', 'HikCameraError', 'device_list')
+
+
+def __getattr__(name):
+    """按需导入 hikcamera 模块中的名称"""
+    if name in _LAZY_NAMES:
+        from . import hikcamera
+        return getattr(hikcamera, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     'HikCamera',
     'HikCameraError',
     'HikCameraConfig',
     'CameraParams',
+    'DeviceInfo',
     'device_list',
     'enumerate_devices',
+    'invalidate_device_cache',
+    'DEVICE_TYPES_ALL',
+    'DEVICE_TYPES_USB',
+    'DEVICE_TYPES_GIGE',
     'decoding_char',
 ]
 
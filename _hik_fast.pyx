@@ -0,0 +1,199 @@
+# -- coding: utf-8 --
+# cython: language_level=3, boundscheck=False, wraparound=False
+# distutils: include_dirs = /opt/MVS/include
+# distutils: library_dirs = /opt/MVS/lib/64
+# distutils: libraries = MvCameraControl
+"""海康 SDK 加速扩展（可选）
+
+- get_and_copy: 在一次释放 GIL 的调用中完成 MV_CC_GetImageBuffer、memcpy 和
+  MV_CC_FreeImageBuffer，多台相机各自的采集线程可以真正并行地等待帧
+- read_device_list: 直接在 C 结构体上读取枚举结果中的设备字段，
+  避免逐字段的 ctypes 属性访问（字符串由 utils.decoding_char 解码）
+
+未编译该扩展时，hikcamera 自动使用纯 ctypes 实现。
+
+构建（Linux，需要 Cython 与 MVS SDK）::
+
+    cythonize -i _hik_fast.pyx
+
+Windows 下请通过 INCLUDE / LIB 环境变量指向 MVS 的 Development/Includes
+与 Development/Libraries 目录后再构建。
+"""
+
+from libc.string cimport memchr, memcpy, memset
+
+
+cdef extern from "MvCameraControl.h":
+    ctypedef struct MV_FRAME_OUT_INFO_EX:
+        unsigned short nWidth
+        unsigned short nHeight
+        int enPixelType
+        unsigned int nFrameLen
+
+    ctypedef struct MV_FRAME_OUT:
+        unsigned char* pBufAddr
+        MV_FRAME_OUT_INFO_EX stFrameInfo
+
+    enum:
+        MV_E_UNKNOW
+        MV_GIGE_DEVICE
+        MV_GENTL_GIGE_DEVICE
+        MV_USB_DEVICE
+        MV_GENTL_CAMERALINK_DEVICE
+        MV_GENTL_CXP_DEVICE
+        MV_GENTL_XOF_DEVICE
+
+    ctypedef struct MV_GIGE_DEVICE_INFO:
+        unsigned int nCurrentIp
+        unsigned char chModelName[32]
+        unsigned char chSerialNumber[16]
+
+    ctypedef struct MV_USB3_DEVICE_INFO:
+        unsigned char chModelName[64]
+        unsigned char chSerialNumber[64]
+
+    ctypedef struct MV_CML_DEVICE_INFO:
+        unsigned char chModelName[64]
+        unsigned char chSerialNumber[64]
+
+    ctypedef struct MV_CXP_DEVICE_INFO:
+        unsigned char chModelName[64]
+        unsigned char chSerialNumber[64]
+
+    ctypedef struct MV_XOF_DEVICE_INFO:
+        unsigned char chModelName[64]
+        unsigned char chSerialNumber[64]
+
+    # 头文件中为匿名联合体，这里的类型名只用于字段访问
+    union _MV_SPECIAL_INFO:
+        MV_GIGE_DEVICE_INFO stGigEInfo
+        MV_USB3_DEVICE_INFO stUsb3VInfo
+        MV_CML_DEVICE_INFO stCMLInfo
+        MV_CXP_DEVICE_INFO stCXPInfo
+        MV_XOF_DEVICE_INFO stXoFInfo
+
+    ctypedef struct MV_CC_DEVICE_INFO:
+        unsigned int nTLayerType
+        _MV_SPECIAL_INFO SpecialInfo
+
+    ctypedef struct MV_CC_DEVICE_INFO_LIST:
+        unsigned int nDeviceNum
+        MV_CC_DEVICE_INFO* pDeviceInfo[256]
+
+    int MV_CC_GetImageBuffer(void* handle, MV_FRAME_OUT* pstFrame, unsigned int nMsec) nogil
+    int MV_CC_FreeImageBuffer(void* handle, MV_FRAME_OUT* pstFrame) nogil
+
+
+def get_and_copy(size_t handle, unsigned char[::1] out, unsigned int timeout):
+    """取一帧并复制到 out，整个过程不持有 GIL
+
+    Args:
+        handle: 设备句柄地址（MvCamera 内部句柄的整数值）
+        out: 一维连续 uint8 缓冲区，大小应不小于 PayloadSize
+        timeout: 等待帧的超时时间（毫秒）
+
+    Returns:
+        (ret, frame_len, width, height, pixel_type)；ret 非 0 时（例如超时返回
+        MV_E_NODATA，SDK 返回空缓冲区时为 MV_E_UNKNOW）其余字段均为 0。frame_len 为帧的实际长度，大于 out 时
+        只复制了 out 能容纳的部分，调用方应丢弃该帧
+    """
+    cdef MV_FRAME_OUT frame
+    cdef unsigned int ret
+    cdef size_t frame_len = 0
+    cdef size_t copy_len
+    cdef size_t capacity = out.shape[0]
+    cdef unsigned char* dst = &out[0]
+
+    memset(&frame, 0, sizeof(frame))
+    with nogil:
+        ret = <unsigned int>MV_CC_GetImageBuffer(<void*>handle, &frame, timeout)
+        if ret == 0:
+            if frame.pBufAddr != NULL:
+                frame_len = frame.stFrameInfo.nFrameLen
+                copy_len = frame_len if frame_len <= capacity else capacity
+                memcpy(dst, frame.pBufAddr, copy_len)
+            else:
+                ret = <unsigned int>MV_E_UNKNOW
+            # 取帧成功时 SDK 已分配了帧节点，缓冲区为空也要归还
+            MV_CC_FreeImageBuffer(<void*>handle, &frame)
+
+    if ret != 0:
+        return ret, 0, 0, 0, 0
+    return (0, frame_len, frame.stFrameInfo.nWidth, frame.stFrameInfo.nHeight,
+            frame.stFrameInfo.enPixelType)
+
+
+cdef bytes _trim(const unsigned char* data, size_t size):
+    """截取以 NUL 结尾的定长字符数组的有效部分，解码统一交给 utils.decoding_char"""
+    cdef const unsigned char* end = <const unsigned char*>memchr(data, 0, size)
+    cdef size_t length = size if end == NULL else <size_t>(end - data)
+    return (<const char*>data)[:length]
+
+
+def read_device_list(size_t list_addr):
+    """读取 MV_CC_DEVICE_INFO_LIST 中每个设备的基本字段
+
+    Args:
+        list_addr: MV_CC_DEVICE_INFO_LIST 结构体地址（ctypes.addressof 的结果）
+
+    Returns:
+        [(nTLayerType, model_name, serial_number, ip), ...]，型号与序列号为截去结尾
+        空字符的 bytes（未知传输层为 b""），ip 为 nCurrentIp 整数，非 GigE 设备为 None
+    """
+    cdef MV_CC_DEVICE_INFO_LIST* device_list = <MV_CC_DEVICE_INFO_LIST*>list_addr
+    cdef MV_CC_DEVICE_INFO* info
+    cdef unsigned int i, tlayer_type
+    cdef list devices = []
+
+    for i in range(device_list.nDeviceNum):
+        info = device_list.pDeviceInfo[i]
+        tlayer_type = info.nTLayerType
+        if tlayer_type == MV_GIGE_DEVICE or tlayer_type == MV_GENTL_GIGE_DEVICE:
+            devices.append((
+                tlayer_type,
+                _trim(info.SpecialInfo.stGigEInfo.chModelName,
+                      sizeof(info.SpecialInfo.stGigEInfo.chModelName)),
+                _trim(info.SpecialInfo.stGigEInfo.chSerialNumber,
+                      sizeof(info.SpecialInfo.stGigEInfo.chSerialNumber)),
+                info.SpecialInfo.stGigEInfo.nCurrentIp,
+            ))
+        elif tlayer_type == MV_USB_DEVICE:
+            devices.append((
+                tlayer_type,
+                _trim(info.SpecialInfo.stUsb3VInfo.chModelName,
+                      sizeof(info.SpecialInfo.stUsb3VInfo.chModelName)),
+                _trim(info.SpecialInfo.stUsb3VInfo.chSerialNumber,
+                      sizeof(info.SpecialInfo.stUsb3VInfo.chSerialNumber)),
+                None,
+            ))
+        elif tlayer_type == MV_GENTL_CAMERALINK_DEVICE:
+            devices.append((
+                tlayer_type,
+                _trim(info.SpecialInfo.stCMLInfo.chModelName,
+                      sizeof(info.SpecialInfo.stCMLInfo.chModelName)),
+                _trim(info.SpecialInfo.stCMLInfo.chSerialNumber,
+                      sizeof(info.SpecialInfo.stCMLInfo.chSerialNumber)),
+                None,
+            ))
+        elif tlayer_type == MV_GENTL_CXP_DEVICE:
+            devices.append((
+                tlayer_type,
+                _trim(info.SpecialInfo.stCXPInfo.chModelName,
+                      sizeof(info.SpecialInfo.stCXPInfo.chModelName)),
+                _trim(info.SpecialInfo.stCXPInfo.chSerialNumber,
+                      sizeof(info.SpecialInfo.stCXPInfo.chSerialNumber)),
+                None,
+            ))
+        elif tlayer_type == MV_GENTL_XOF_DEVICE:
+            devices.append((
+                tlayer_type,
+                _trim(info.SpecialInfo.stXoFInfo.chModelName,
+                      sizeof(info.SpecialInfo.stXoFInfo.chModelName)),
+                _trim(info.SpecialInfo.stXoFInfo.chSerialNumber,
+                      sizeof(info.SpecialInfo.stXoFInfo.chSerialNumber)),
+                None,
+            ))
+        else:
+            devices.append((tlayer_type, b"", b"", None))
+
+    return devices
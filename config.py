@@ -2,7 +2,7 @@
 """海康相机配置类"""
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, NamedTuple
 
 
 @dataclass
@@ -50,34 +50,80 @@ class CameraParams:
         return f"CameraParams({params})"
 
 
-@dataclass
+class DeviceInfo(NamedTuple):
+    """设备信息
+
+    NamedTuple，通过属性访问字段（info.model_name），需要字典时使用 to_dict()。
+
+    Attributes:
+        index: 设备在枚举结果中的索引，未知时为 -1
+        type: 设备类型，如 "GigE"、"USB3 Vision"
+        model_name: 型号
+        serial_number: 序列号
+        ip_address: IP 地址，仅 GigE 设备有效
+    """
+    index: int = -1
+    type: str = ""
+    model_name: str = ""
+    serial_number: str = ""
+    ip_address: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典"""
+        return self._asdict()
+
+
+@dataclass(frozen=True)
 class HikCameraConfig:
     """海康相机配置类
 
+    配置在构造后只读，相机运行中的参数修改通过 HikCamera 的属性或 set_params 完成。
+
     Attributes:
         camera_index: 设备索引，默认0（第一个设备）
+        serial_number: 设备序列号。设置后按序列号打开相机，忽略 camera_index
+        tlayer_type: 查找设备时枚举的传输层类型（如 utils.DEVICE_TYPES_USB），
+            None 表示全部。限定为实际使用的传输层可以跳过耗时的 GigE 发现
         trigger_mode: 触发模式，"continuous"(连续采集) 或 "trigger"(触发采集)
         width: 图像宽度
         height: 图像高度
         exposure: 曝光时间（微秒）
         gain: 增益
-        fps: 帧率
+        fps: 帧率上限。设置后打开相机时启用 AcquisitionFrameRate 限制采集帧率，
+            None（默认）时不修改相机当前的帧率设置
         timeout: 获取图像超时时间（毫秒）
+        image_node_num: SDK 图像缓存节点数。节点越少，缓存中排队的旧帧越少、
+            端到端延迟越低；但处理偶尔变慢时更容易丢帧。默认 2
+        grab_mode: 取帧方式，"thread"(后台线程调用 MV_CC_GetImageBuffer) 或
+            "callback"(注册 SDK 图像回调，直接在 SDK 缓冲区上转换，少一次取放缓冲区)
+        fused_wb: 8 位 Bayer 格式的每通道白平衡增益 (r_gain, g_gain, b_gain)。
+            设置后使用 numba 内核一次遍历完成去马赛克和增益，需要安装 numba
+        mono_as_gray: 单色相机是否直接返回 (H, W) 灰度图，默认 True。
+            设为 False 时扩展为 3 通道 BGR，内存写入量为灰度图的 3 倍
     """
     camera_index: int = 0
+    serial_number: Optional[str] = None
+    tlayer_type: Optional[int] = None
     trigger_mode: str = "continuous"
     width: int = 1280
     height: int = 720
     exposure: int = 10000
     gain: float = 0.0
-    fps: int = 30
+    fps: Optional[float] = None
     timeout: int = 1000
+    image_node_num: int = 2
+    grab_mode: str = "thread"
+    fused_wb: Optional[Tuple[float, float, float]] = None
+    mono_as_gray: bool = True
 
     def __post_init__(self):
         """验证配置参数"""
         if self.trigger_mode not in ("continuous", "trigger"):
             raise ValueError(f"Invalid trigger_mode: {self.trigger_mode}. "
                            f"Must be 'continuous' or 'trigger'")
+        if self.grab_mode not in ("thread", "callback"):
+            raise ValueError(f"Invalid grab_mode: {self.grab_mode}. "
+                           f"Must be 'thread' or 'callback'")
         if self.camera_index < 0:
             raise ValueError(f"camera_index must be non-negative, got {self.camera_index}")
         if self.width <= 0 or self.height <= 0:
@@ -86,7 +132,12 @@ class HikCameraConfig:
             raise ValueError(f"exposure must be non-negative")
         if self.gain < 0:
             raise ValueError(f"gain must be non-negative")
-        if self.fps <= 0:
+        if self.fps is not None and self.fps <= 0:
             raise ValueError(f"fps must be positive")
         if self.timeout <= 0:
             raise ValueError(f"timeout must be positive")
+        if self.image_node_num <= 0:
+            raise ValueError(f"image_node_num must be positive")
+        if self.fused_wb is not None:
+            if len(self.fused_wb) != 3 or any(g < 0 for g in self.fused_wb):
+                raise ValueError(f"fused_wb must be 3 non-negative gains (r, g, b)")
@@ -9,50 +9,92 @@ Example:
     ...     cv2.imshow("image", image)
 """
 
-import sys
-import platform
-import os
+import atexit
+import threading
+import time
+import weakref
 from ctypes import *
-from ctypes import memmove
-from typing import Optional, Dict, Any
-
-
-def copy_bytes(source, length):
-    """从 ctypes 指针复制字节数据到 bytes 对象"""
-    buffer = (c_ubyte * length)()
-    memmove(buffer, source, length)
-    return bytes(buffer)
-
-# 兼容不同操作系统加载动态库
-currentsystem = platform.system()
-if currentsystem == 'Windows':
-    mvs_path = os.path.join(os.getenv('MVCAM_COMMON_RUNENV'), "Samples", "Python", "MvImport")
-else:
-    mvs_path = "/opt/MVS/Samples/64/Python/MvImport"
-
-if mvs_path not in sys.path:
-    sys.path.append(mvs_path)
+from typing import Optional, Dict, Any, List, Tuple
 
 import numpy as np
 import cv2
-from MvCameraControl_class import *
 
 from .utils import (
+    _mvs,
+    currentsystem,
     decoding_char,
     get_device_info,
     enumerate_devices,
-    is_bayer_format,
+    enum_device_list,
+    DEVICE_TYPES_ALL,
+    invalidate_device_cache,
+    find_device_by_serial,
     is_mono_format,
-    is_rgb_format,
     BAYER_TO_COLOR_CODE,
+    get_bayer_meta,
     get_pixel_format_name,
 )
-from .config import HikCameraConfig, CameraParams
+from .config import HikCameraConfig, CameraParams, DeviceInfo
+
+# SDK 模块由 utils 从 MVS 安装目录加载到 sys.modules，不修改 sys.path
+_mvs()
+from MvCameraControl_class import *
+
+from .demosaic import bayer_to_bgr_fused, BAYER_RED_OFFSET
+
+# 可选的 Cython 取帧扩展：取帧、复制、释放缓冲区全程释放 GIL，未编译时使用 ctypes
+try:
+    from . import _hik_fast
+except ImportError:
+    _hik_fast = None
 
 
-# 全局 SDK 初始化标志
+# 全局 SDK 初始化标志：进程内只初始化一次，解释器退出时反初始化
 _SDK_INITIALIZED = False
-_SDK_INIT_COUNT = 0
+_SDK_LOCK = threading.Lock()
+# 已打开设备的相机，退出时在反初始化 SDK 之前先逐个关闭
+_LIVE_CAMERAS: "weakref.WeakSet[HikCamera]" = weakref.WeakSet()
+
+# 后台采集线程每次等待帧的超时时间（毫秒），决定 stop() 的响应速度
+_GRAB_POLL_TIMEOUT = 100
+
+# SDK 图像回调函数类型: void (*)(unsigned char* pData, MV_FRAME_OUT_INFO_EX* pFrameInfo, void* pUser)
+_CALLBACK_FUNCTYPE = WINFUNCTYPE if currentsystem == 'Windows' else CFUNCTYPE
+_FrameCallback = _CALLBACK_FUNCTYPE(None, POINTER(c_ubyte), POINTER(MV_FRAME_OUT_INFO_EX), c_void_p)
+
+# Bayer 颜色码（BAYER_TO_COLOR_CODE 的取值）到 OpenCV 转换码的映射。
+# OpenCV 旧式 COLOR_BAYER_XX 常量按 2x2 单元的第二行命名，
+# 例如 BayerGR（G R / B G）对应的是 COLOR_BAYER_GB2BGR。
+# 按 PFNC 命名的 COLOR_BayerXXXX 别名只在较新的 OpenCV 中提供，这里使用旧式常量
+_BAYER_CV_CODES = (
+    cv2.COLOR_BAYER_GB2BGR,  # BayerGR（= COLOR_BayerGRBG2BGR）
+    cv2.COLOR_BAYER_BG2BGR,  # BayerRG（= COLOR_BayerRGGB2BGR）
+    cv2.COLOR_BAYER_GR2BGR,  # BayerGB（= COLOR_BayerGBRG2BGR）
+    cv2.COLOR_BAYER_RG2BGR,  # BayerBG（= COLOR_BayerBGGR2BGR）
+)
+
+# 8 位 Bayer 格式（可使用融合白平衡内核）
+_BAYER8_FORMATS = frozenset((
+    PixelType_Gvsp_BayerGR8,
+    PixelType_Gvsp_BayerRG8,
+    PixelType_Gvsp_BayerGB8,
+    PixelType_Gvsp_BayerBG8,
+))
+
+# 像素格式 -> (通道数, OpenCV 转换码)，转换码为 None 表示已是 BGR 无需转换
+# 源数据按每通道 1 字节解释，因此只收录 8 位格式；高位深与 Packed 格式
+# 只能由 SDK 转换，SDK 转换失败时报告不支持的像素格式
+_CONVERT_TABLE = {
+    PixelType_Gvsp_RGB8_Packed: (3, cv2.COLOR_RGB2BGR),
+    PixelType_Gvsp_BGR8_Packed: (3, None),
+    PixelType_Gvsp_RGBA8_Packed: (4, cv2.COLOR_RGBA2BGR),
+    PixelType_Gvsp_BGRA8_Packed: (4, cv2.COLOR_BGRA2BGR),
+    PixelType_Gvsp_Mono8: (1, cv2.COLOR_GRAY2BGR),
+}
+_CONVERT_TABLE.update(
+    (pixel_type, (1, _BAYER_CV_CODES[BAYER_TO_COLOR_CODE[pixel_type]]))
+    for pixel_type in _BAYER8_FORMATS
+)
 
 
 class HikCameraError(Exception):
@@ -60,6 +102,38 @@ class HikCameraError(Exception):
     pass
 
 
+def _ensure_sdk_initialized() -> None:
+    """初始化 SDK（进程内只执行一次）
+
+    Raises:
+        HikCameraError: SDK 初始化失败
+    """
+    global _SDK_INITIALIZED
+
+    with _SDK_LOCK:
+        if _SDK_INITIALIZED:
+            return
+        ret = MvCamera.MV_CC_Initialize()
+        if ret != 0:
+            raise HikCameraError(f"SDK 初始化失败! ret[0x{ret:x}]")
+        atexit.register(_shutdown_sdk)
+        _SDK_INITIALIZED = True
+
+
+def _shutdown_sdk() -> None:
+    """解释器退出时关闭仍打开的相机，再反初始化 SDK
+
+    未关闭的相机可能仍有采集线程或 SDK 回调在访问设备句柄，
+    直接 MV_CC_Finalize 会在它们之下释放 SDK 资源。
+    """
+    for camera in list(_LIVE_CAMERAS):
+        try:
+            camera.close()
+        except Exception as e:
+            print(f"警告: 退出时关闭相机失败: {e}")
+    MvCamera.MV_CC_Finalize()
+
+
 class HikCamera:
     """海康相机简洁接口类
 
@@ -72,63 +146,99 @@ class HikCamera:
     """
 
     def __init__(self, camera_index: int = 0, trigger_mode: str = "continuous",
-                 config: Optional[HikCameraConfig] = None):
+                 config: Optional[HikCameraConfig] = None,
+                 serial: Optional[str] = None, device_info=None):
         """初始化海康相机
 
         Args:
             camera_index: 设备索引，默认0（第一个设备）
             trigger_mode: 触发模式，"continuous"(连续采集) 或 "trigger"(触发采集)
             config: HikCameraConfig 配置对象，如果为 None 则使用默认配置
+            serial: 设备序列号，设置后按序列号打开相机（优先于 config.serial_number）
+            device_info: 要打开的设备。可以是 device_list() 返回的 DeviceInfo
+                （按其序列号在缓存的枚举结果中查找，序列号为空时按其索引），
+                也可以是已枚举得到的 MV_CC_DEVICE_INFO 对象或指针（直接打开，不再枚举）
 
         Raises:
             HikCameraError: 没有找到相机或打开失败
         """
-        global _SDK_INITIALIZED, _SDK_INIT_COUNT
-
         # 初始化 SDK（全局唯一）
-        if not _SDK_INITIALIZED:
-            ret = MvCamera.MV_CC_Initialize()
-            if ret != 0:
-                raise HikCameraError(f"SDK 初始化失败! ret[0x{ret:x}]")
-            _SDK_INITIALIZED = True
-        _SDK_INIT_COUNT += 1
+        _ensure_sdk_initialized()
 
         self._cam = MvCamera()
         self._config = config or HikCameraConfig(
             camera_index=camera_index,
             trigger_mode=trigger_mode
         )
+        if self._config.fused_wb is not None and bayer_to_bgr_fused is None:
+            raise HikCameraError("fused_wb 需要安装 numba")
+        # 运行时可变状态；配置对象构造后只读
+        self._state: Dict[str, Any] = {'trigger_mode': self._config.trigger_mode}
         self._is_running = False
-        self._device_info: Optional[Dict[str, Any]] = None
+        self._device_info: Optional[DeviceInfo] = None
         self._pixel_type = None
         self._nPayloadSize = 0
+        # 复用的输出缓冲区（仅在图像形状变化时重新分配）
+        self._frame_out: Optional[np.ndarray] = None
+        # 按像素格式选定的专用转换方法，像素格式变化时重新选择
+        self._converter = None
+        self._cv_conversion = None
+        self._bayer_meta = None
+        self._bayer_red_offset = None
+        # SDK 转换对当前像素格式是否成功过，从未成功时才永久改用 OpenCV 转换
+        self._sdk_convert_ok = False
+        # 上一帧的 (高, 宽, 像素格式)，以及据此预先计算的源数据视图与输出缓冲区形状
+        self._last_shape = None
+        self._src_shape = None
+        self._out_shape = None
+        # 直接按 _src_shape 读取 SDK 缓冲区的转换方法所需的最少字节数，0 表示由 SDK 校验
+        self._src_bytes = 0
+
+        # 后台采集线程或 SDK 回调，只保留最新一帧
+        self._grab_thread: Optional[threading.Thread] = None
+        self._frame_callback = None
+        # 采集线程复用的帧结构体，避免每帧构造 ctypes 对象
+        self._st_out_frame = MV_FRAME_OUT()
+        self._latest_frame: Optional[np.ndarray] = None
+        self._latest_error: Optional[HikCameraError] = None
+        self._latest_lock = threading.Lock()
+        self._latest_event = threading.Event()
+
+        # 参数值缓存，setter 调用时失效对应项，refresh_params() 全部清空
+        self._param_cache: Dict[str, Any] = {}
+        # 最近一次成功写入的节点值，值未变化时跳过 SDK 调用
+        self._node_cache: Dict[str, Any] = {}
+
+        # 自动连接。打开设备之后的步骤失败时调用方拿不到对象，无法 close()，
+        # 这里关闭设备，避免独占打开的设备在进程内一直被占用
+        try:
+            self._auto_connect(serial or self._config.serial_number, device_info)
+        except BaseException:
+            self.close()
+            raise
 
-        # 自动连接
-        self._auto_connect()
-
-    def _auto_connect(self) -> None:
-        """自动连接相机"""
-        # 重新枚举设备，获取原始 deviceList
-        deviceList = MV_CC_DEVICE_INFO_LIST()
-        tlayerType = (MV_GIGE_DEVICE | MV_USB_DEVICE | MV_GENTL_CAMERALINK_DEVICE
-                      | MV_GENTL_CXP_DEVICE | MV_GENTL_XOF_DEVICE)
-
-        ret = MvCamera.MV_CC_EnumDevices(tlayerType, deviceList)
-        if ret != 0:
-            raise HikCameraError(f"枚举设备失败! ret[0x{ret:x}]")
-
-        if deviceList.nDeviceNum == 0:
-            raise HikCameraError("未找到可用的海康相机设备")
+    def _auto_connect(self, serial: Optional[str] = None, device_info=None) -> None:
+        """自动连接相机
 
-        idx = self._config.camera_index
-        if idx >= deviceList.nDeviceNum:
-            raise HikCameraError(f"设备索引 {idx} 超出范围，共有 {deviceList.nDeviceNum} 个设备")
-
-        # 获取设备信息
-        mvcc_dev_info = cast(
-            deviceList.pDeviceInfo[idx],
-            POINTER(MV_CC_DEVICE_INFO)
-        ).contents
+        Args:
+            serial: 设备序列号，为 None 时按 camera_index 选择设备
+            device_info: DeviceInfo，或已枚举得到的 MV_CC_DEVICE_INFO 对象或指针
+        """
+        if device_info is None:
+            mvcc_dev_info = self._find_device(serial)
+        elif isinstance(device_info, DeviceInfo):
+            if device_info.serial_number:
+                mvcc_dev_info = self._find_device(device_info.serial_number)
+            elif device_info.index >= 0:
+                mvcc_dev_info = self._find_device(index=device_info.index)
+            else:
+                raise HikCameraError("device_info 既没有序列号也没有有效的索引")
+        else:
+            mvcc_dev_info = device_info.contents if hasattr(device_info, 'contents') else device_info
+            if not hasattr(mvcc_dev_info, 'nTLayerType'):
+                raise HikCameraError(
+                    f"不支持的 device_info 类型: {type(device_info).__name__}"
+                )
 
         # 保存设备信息
         self._device_info = get_device_info(mvcc_dev_info)
@@ -136,13 +246,19 @@ class HikCamera:
         # 创建设备句柄
         ret = self._cam.MV_CC_CreateHandle(mvcc_dev_info)
         if ret != 0:
+            self._cam = None
+            invalidate_device_cache()
             raise HikCameraError(f"创建句柄失败! ret[0x{ret:x}]")
 
         # 打开设备
         ret = self._cam.MV_CC_OpenDevice(MV_ACCESS_Exclusive, 0)
         if ret != 0:
             self._cam.MV_CC_DestroyHandle()
+            self._cam = None
+            # 缓存的枚举结果可能已过期（设备被拔出或 IP 变化），下次重新枚举
+            invalidate_device_cache()
             raise HikCameraError(f"打开设备失败! ret[0x{ret:x}]")
+        _LIVE_CAMERAS.add(self)
 
         # GigE 相机优化包大小
         if mvcc_dev_info.nTLayerType == MV_GIGE_DEVICE:
@@ -150,49 +266,233 @@ class HikCamera:
             if int(nPacketSize) > 0:
                 self._cam.MV_CC_SetIntValue("GevSCPSPacketSize", nPacketSize)
 
+        # 减少 SDK 缓存节点数，避免旧帧在队列中堆积造成延迟
+        ret = self._cam.MV_CC_SetImageNodeNum(self._config.image_node_num)
+        if ret != 0:
+            print(f"警告: 设置图像缓存节点数失败 (ret=0x{ret:x})")
+
+        # 配置了帧率时按该帧率采集，使相机输出速率与处理速率匹配
+        if self._config.fps is not None:
+            ret = self._cam.MV_CC_SetBoolValue("AcquisitionFrameRateEnable", True)
+            if ret != 0:
+                print(f"警告: 启用帧率控制失败 (ret=0x{ret:x})")
+            ret = self._set_float("AcquisitionFrameRate", float(self._config.fps))
+            if ret != 0:
+                print(f"警告: 设置采集帧率失败 (ret=0x{ret:x})")
+
         # 设置触发模式
-        if self._config.trigger_mode == "trigger":
-            self._cam.MV_CC_SetEnumValue("TriggerMode", MV_TRIGGER_MODE_ON)
-            # 设置触发源为软件触发
-            self._cam.MV_CC_SetEnumValue("TriggerSource", MV_TRIGGER_SOURCE_SOFTWARE)
-        else:
-            self._cam.MV_CC_SetEnumValue("TriggerMode", MV_TRIGGER_MODE_OFF)
+        self._apply_trigger_mode(self._state['trigger_mode'])
+
+        # 回调模式：由 SDK 直接推送帧数据，需在开始取流前注册
+        if self._config.grab_mode == "callback":
+            self._frame_callback = _FrameCallback(self._on_frame)
+            ret = self._cam.MV_CC_RegisterImageCallBackEx(self._frame_callback, None)
+            if ret != 0:
+                raise HikCameraError(f"注册图像回调失败! ret[0x{ret:x}]")
 
         # 获取有效载荷大小
+        self._nPayloadSize = self._query_payload_size()
+
+    def _query_payload_size(self) -> int:
+        """查询当前的有效载荷大小（随宽高、像素格式变化）"""
         stParam = MVCC_INTVALUE()
         ret = self._cam.MV_CC_GetIntValue("PayloadSize", stParam)
         if ret != 0:
             raise HikCameraError(f"获取 PayloadSize 失败! ret[0x{ret:x}]")
-        self._nPayloadSize = stParam.nCurValue
+        return stParam.nCurValue
+
+    def _find_device(self, serial: Optional[str] = None, index: Optional[int] = None):
+        """在（缓存的）枚举结果中查找要打开的设备
+
+        Args:
+            serial: 设备序列号，为 None 时按索引选择设备
+            index: 设备索引，为 None 时使用 camera_index
+
+        Returns:
+            MV_CC_DEVICE_INFO 对象
+        """
+        tlayer_type = self._config.tlayer_type
+        if tlayer_type is None:
+            tlayer_type = DEVICE_TYPES_ALL
+
+        ret, deviceList = enum_device_list(tlayer_type)
+        if ret != 0:
+            raise HikCameraError(f"枚举设备失败! ret[0x{ret:x}]")
+
+        if serial is not None:
+            mvcc_dev_info = find_device_by_serial(deviceList, serial)
+            if mvcc_dev_info is None:
+                # 缓存中没有时重新枚举一次，可能是刚接入的设备
+                ret, deviceList = enum_device_list(tlayer_type, force=True)
+                if ret != 0:
+                    raise HikCameraError(f"枚举设备失败! ret[0x{ret:x}]")
+                mvcc_dev_info = find_device_by_serial(deviceList, serial)
+            if mvcc_dev_info is None:
+                raise HikCameraError(f"未找到序列号为 {serial} 的设备")
+            return mvcc_dev_info
+
+        if deviceList.nDeviceNum == 0:
+            raise HikCameraError("未找到可用的海康相机设备")
+
+        idx = self._config.camera_index if index is None else index
+        if idx >= deviceList.nDeviceNum:
+            raise HikCameraError(f"设备索引 {idx} 超出范围，共有 {deviceList.nDeviceNum} 个设备")
+
+        return cast(deviceList.pDeviceInfo[idx], POINTER(MV_CC_DEVICE_INFO)).contents
 
     def start(self) -> None:
-        """开始采集"""
+        """开始采集，线程模式下同时启动后台采集线程"""
         if self._is_running:
             return
 
+        # 打开设备后宽高或像素格式可能已被修改，重新查询有效载荷大小
+        self._nPayloadSize = self._query_payload_size()
+
         ret = self._cam.MV_CC_StartGrabbing()
         if ret != 0:
             raise HikCameraError(f"开始采集失败! ret[0x{ret:x}]")
         self._is_running = True
 
+        self._latest_event.clear()
+        if self._frame_callback is None:
+            target = self._grab_loop if _hik_fast is None else self._grab_loop_fast
+            self._grab_thread = threading.Thread(
+                target=target, name="HikCameraGrab", daemon=True
+            )
+            self._grab_thread.start()
+
     def stop(self) -> None:
         """停止采集"""
         if not self._is_running:
             return
 
+        # 先结束后台采集线程，再停止 SDK 取流
+        self._is_running = False
+        if self._grab_thread is not None:
+            self._grab_thread.join()
+            self._grab_thread = None
+
         ret = self._cam.MV_CC_StopGrabbing()
         if ret != 0:
             raise HikCameraError(f"停止采集失败! ret[0x{ret:x}]")
-        self._is_running = False
+
+    def _grab_loop(self) -> None:
+        """后台采集线程：持续从 SDK 取帧，只保留最新一帧"""
+        stOutFrame = self._st_out_frame
+        frame_size = sizeof(stOutFrame)
+        while self._is_running:
+            memset(byref(stOutFrame), 0, frame_size)
+
+            ret = self._cam.MV_CC_GetImageBuffer(stOutFrame, _GRAB_POLL_TIMEOUT)
+            if ret != 0 or not stOutFrame.pBufAddr:
+                if ret != MV_E_NODATA:
+                    self._report_grab_error(ret)
+                continue
+
+            try:
+                # 转换图像数据
+                image, error = self._try_convert(stOutFrame.pBufAddr, stOutFrame.stFrameInfo)
+            finally:
+                self._cam.MV_CC_FreeImageBuffer(stOutFrame)
+
+            self._publish_frame(image, error)
+
+    def _grab_loop_fast(self) -> None:
+        """后台采集线程（_hik_fast 扩展）：取帧、复制、释放在一次无 GIL 调用中完成
+
+        帧数据复制到固定的原始缓冲区后再转换，转换期间 SDK 缓冲区已归还，
+        其他相机的采集线程不会被本线程持有的 GIL 阻塞。
+        """
+        raw = np.empty(self._nPayloadSize, dtype=np.uint8)
+        pRaw = raw.ctypes.data_as(POINTER(c_ubyte))
+        stFrameInfo = self._st_out_frame.stFrameInfo
+        # MvCamera.handle 中保存的就是设备句柄的地址
+        handle = cast(self._cam.handle, c_void_p).value
+        while self._is_running:
+            ret, frame_len, width, height, pixel_type = _hik_fast.get_and_copy(
+                handle, raw, _GRAB_POLL_TIMEOUT
+            )
+            if ret != 0:
+                if ret != MV_E_NODATA:
+                    self._report_grab_error(ret)
+                continue
+
+            if frame_len > raw.size:
+                # 帧比缓冲区大时只复制了一部分：丢弃该帧并报告错误，下一帧使用更大的缓冲区
+                self._publish_frame(None, HikCameraError(
+                    f"帧数据超出缓冲区! 长度[{frame_len}] 缓冲区[{raw.size}]"
+                ))
+                raw = np.empty(frame_len, dtype=np.uint8)
+                pRaw = raw.ctypes.data_as(POINTER(c_ubyte))
+                continue
+
+            stFrameInfo.nWidth = width
+            stFrameInfo.nHeight = height
+            stFrameInfo.enPixelType = pixel_type
+            stFrameInfo.nFrameLen = frame_len
+
+            image, error = self._try_convert(pRaw, stFrameInfo)
+            self._publish_frame(image, error)
+
+    def _try_convert(self, pData, stFrameInfo
+                     ) -> Tuple[Optional[np.ndarray], Optional[HikCameraError]]:
+        """转换一帧，返回 (图像, 错误)
+
+        采集线程和 SDK 回调中不能让异常逃逸：线程会直接退出，回调则会把异常
+        抛进 SDK。这里把 numpy/OpenCV 等抛出的其他异常也包装为 HikCameraError，
+        交给 get_image 抛出。
+        """
+        try:
+            return self._convert_frame(pData, stFrameInfo), None
+        except HikCameraError as e:
+            return None, e
+        except Exception as e:
+            error = HikCameraError(f"图像转换失败! {e!r}")
+            error.__cause__ = e
+            return None, error
+
+    def _report_grab_error(self, ret: int) -> None:
+        """非超时的取帧错误交给 get_image 抛出，并稍作等待避免空转"""
+        with self._latest_lock:
+            self._latest_error = HikCameraError(f"获取图像失败! ret[0x{ret:x}]")
+            self._latest_event.set()
+        time.sleep(_GRAB_POLL_TIMEOUT / 1000)
+
+    def _on_frame(self, pData, pFrameInfo, pUser) -> None:
+        """SDK 图像回调：直接在 SDK 推送的缓冲区上转换，只保留最新一帧
+
+        回调返回前缓冲区一直有效，无需 MV_CC_GetImageBuffer/FreeImageBuffer。
+        """
+        image, error = self._try_convert(pData, pFrameInfo.contents)
+        self._publish_frame(image, error)
+
+    def _publish_frame(self, image: Optional[np.ndarray],
+                       error: Optional[HikCameraError]) -> None:
+        """发布新帧
+
+        转换结果写在后缓冲区中，这里在锁内与最新帧交换，
+        尚未被 get_image 取走的旧帧会被直接覆盖。
+        """
+        with self._latest_lock:
+            if image is not None:
+                self._frame_out = self._latest_frame
+                self._latest_frame = image
+            self._latest_error = error
+            self._latest_event.set()
 
     def get_image(self, timeout: Optional[int] = None) -> np.ndarray:
         """获取一帧图像（连续采集模式下获取最新帧）
 
+        图像由后台采集线程或 SDK 回调持续获取，这里只等待并返回最新的一帧；
+        每次调用返回的都是上次调用之后到达的新帧。
+        返回的数组是独立的副本，可以跨帧保留。
+
         Args:
             timeout: 超时时间（毫秒），默认使用配置中的值
 
         Returns:
-            BGR 格式的 numpy 数组
+            BGR 格式的 numpy 数组；单色格式且 mono_as_gray 为 True 时
+            为 (H, W) 的灰度数组
 
         Raises:
             HikCameraError: 获取图像失败或超时
@@ -200,22 +500,81 @@ class HikCamera:
         if not self._is_running:
             raise HikCameraError("相机未开始采集，请先调用 start()")
 
+        return self._take_latest(timeout or self._config.timeout)
+
+    def get_images(self, n: int, out: Optional[np.ndarray] = None,
+                   timeout: Optional[int] = None) -> np.ndarray:
+        """连续获取 n 帧新图像，按顺序写入一个 (n,) + 单帧形状的数组
+
+        适合批量处理的算法：传入上一批的结果作为 out 可以复用同一块内存，
+        每帧只做一次复制，不再逐帧分配数组。
+
+        Args:
+            n: 帧数
+            out: 预分配的输出数组，形状为 (至少 n,) + 单帧形状、dtype 为 uint8；
+                为 None 时按第一帧的形状自动分配
+            timeout: 每帧的超时时间（毫秒），默认使用配置中的值
+
+        Returns:
+            包含 n 帧图像的 numpy 数组（out 的前 n 帧）
+
+        Raises:
+            HikCameraError: 获取图像失败或超时，或 out 的 dtype、形状与帧不匹配
+                （形状不匹配时该帧不会被取走）
+        """
+        if not self._is_running:
+            raise HikCameraError("相机未开始采集，请先调用 start()")
+        if n <= 0:
+            raise HikCameraError(f"帧数必须为正数: {n}")
+
         timeout = timeout or self._config.timeout
 
-        stOutFrame = MV_FRAME_OUT()
-        memset(byref(stOutFrame), 0, sizeof(stOutFrame))
+        start = 0
+        if out is None:
+            first = self._take_latest(timeout)
+            out = np.empty((n,) + first.shape, dtype=np.uint8)
+            out[0] = first
+            start = 1
+        else:
+            if out.dtype != np.uint8:
+                raise HikCameraError(f"输出数组的 dtype 必须为 uint8: {out.dtype}")
+            if out.ndim < 3:
+                raise HikCameraError(f"输出数组形状 {out.shape} 不是 (帧数,) + 单帧形状")
+            if out.shape[0] < n:
+                raise HikCameraError(f"输出数组只能容纳 {out.shape[0]} 帧，需要 {n} 帧")
 
-        ret = self._cam.MV_CC_GetImageBuffer(stOutFrame, timeout)
-        if None == stOutFrame.pBufAddr or ret != 0:
-            raise HikCameraError(f"获取图像失败! ret[0x{ret:x}]")
+        for i in range(start, n):
+            self._take_latest(timeout, out[i])
 
-        try:
-            # 转换图像数据
-            image = self._convert_frame_to_bgr(stOutFrame)
-        finally:
-            self._cam.MV_CC_FreeImageBuffer(stOutFrame)
+        return out[:n]
+
+    def _take_latest(self, timeout: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """等待一帧尚未取走的新帧并复制出来
 
-        return image
+        Args:
+            timeout: 超时时间（毫秒）
+            out: 复制目标，为 None 时返回新数组；形状必须与帧一致，不做广播
+
+        Returns:
+            最新一帧图像的副本
+        """
+        if not self._latest_event.wait(timeout / 1000):
+            raise HikCameraError(f"获取图像超时! timeout[{timeout}ms]")
+
+        with self._latest_lock:
+            if self._latest_error is not None:
+                self._latest_event.clear()
+                error, self._latest_error = self._latest_error, None
+                raise error
+            frame = self._latest_frame
+            # 形状不匹配时不清除事件，该帧仍可由下一次调用取走
+            if out is not None and out.shape != frame.shape:
+                raise HikCameraError(f"输出数组形状 {out.shape} 与图像形状 {frame.shape} 不一致")
+            self._latest_event.clear()
+            if out is None:
+                return frame.copy()
+            np.copyto(out, frame)
+            return out
 
     def trigger_and_get_image(self, timeout: Optional[int] = None) -> np.ndarray:
         """触发一次并获取图像（触发模式下使用）
@@ -224,14 +583,18 @@ class HikCamera:
             timeout: 超时时间（毫秒），默认使用配置中的值
 
         Returns:
-            BGR 格式的 numpy 数组
+            图像 numpy 数组，格式同 get_image
 
         Raises:
             HikCameraError: 获取图像失败或超时
         """
-        if self._config.trigger_mode != "trigger":
+        if self._state['trigger_mode'] != "trigger":
             raise HikCameraError("trigger_and_get_image 只能在触发模式下使用")
 
+        # 丢弃触发前尚未取走的帧，确保返回本次触发的图像
+        with self._latest_lock:
+            self._latest_event.clear()
+
         # 触发一次
         ret = self._cam.MV_CC_SetCommandValue("TriggerSoftware")
         if ret != 0:
@@ -239,77 +602,182 @@ class HikCamera:
 
         return self.get_image(timeout)
 
-    def _convert_frame_to_bgr(self, stOutFrame: MV_FRAME_OUT) -> np.ndarray:
-        """将帧数据转换为 BGR 格式的 numpy 数组
+    def _convert_frame(self, pData, stFrameInfo: MV_FRAME_OUT_INFO_EX) -> np.ndarray:
+        """将帧数据转换为 numpy 数组
+
+        彩色格式转换为 BGR；单色格式在 mono_as_gray 为 True 时保持 (H, W) 灰度，
+        不扩展为 3 通道。图像尺寸和像素格式在一次采集中通常不变，因此只在它们变化时
+        选择专用转换方法并计算数组形状（见 _specialize），之后每帧直接调用转换方法。
+        转换结果写入复用的输出缓冲区 ``self._frame_out``，下一帧会覆盖其内容。
 
         Args:
-            stOutFrame: 帧数据
+            pData: SDK 图像缓冲区指针 (POINTER(c_ubyte))
+            stFrameInfo: 帧信息
 
         Returns:
-            BGR 格式的 numpy 数组
+            图像 numpy 数组（内部输出缓冲区）
         """
-        width = stOutFrame.stFrameInfo.nWidth
-        height = stOutFrame.stFrameInfo.nHeight
-        pixel_type = stOutFrame.stFrameInfo.enPixelType
-        frame_len = stOutFrame.stFrameInfo.nFrameLen
-        self._pixel_type = pixel_type
-
         # 获取图像数据地址
-        if stOutFrame.pBufAddr is None:
+        if not pData:
             raise HikCameraError("图像缓冲区地址为空")
 
-        # 从 ctypes 指针复制数据到 numpy 数组
-        pData = stOutFrame.pBufAddr
-        image_array = np.frombuffer(copy_bytes(pData, frame_len), dtype=np.uint8)
-
-        # 根据像素格式转换
-        if is_rgb_format(pixel_type):
-            # RGB/BGR 格式直接转换
-            if pixel_type == PixelType_Gvsp_RGB8_Packed:
-                # RGB -> BGR
-                image = image_array.reshape((height, width, 3))
-                image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-            elif pixel_type == PixelType_Gvsp_BGR8_Packed:
-                # BGR 直接使用
-                image = image_array.reshape((height, width, 3))
-            else:
-                # RGBA/BGRA -> BGR
-                image = image_array.reshape((height, width, 4))
-                if pixel_type == PixelType_Gvsp_RGBA8_Packed:
-                    image = cv2.cvtColor(image, cv2.COLOR_RGBA2BGR)
-                else:
-                    image = cv2.cvtColor(image, cv2.COLOR_BGRA2BGR)
-
-        elif is_bayer_format(pixel_type):
-            # Bayer 格式转换为 BGR
-            color_code = BAYER_TO_COLOR_CODE.get(pixel_type, 0)
-            image = image_array.reshape((height, width))
-
-            if color_code == 0:  # BayerGR
-                image = cv2.cvtColor(image, cv2.COLOR_BAYER_GR2BGR)
-            elif color_code == 1:  # BayerRG
-                image = cv2.cvtColor(image, cv2.COLOR_BAYER_RG2BGR)
-            elif color_code == 2:  # BayerGB
-                image = cv2.cvtColor(image, cv2.COLOR_BAYER_GB2BGR)
-            else:  # BayerBG
-                image = cv2.cvtColor(image, cv2.COLOR_BAYER_BG2BGR)
-
-        elif is_mono_format(pixel_type):
-            # 单色格式直接使用，转换为 3 通道
-            image = image_array.reshape((height, width))
-            image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
+        key = (stFrameInfo.nHeight, stFrameInfo.nWidth, stFrameInfo.enPixelType)
+        if key != self._last_shape:
+            self._specialize(key)
 
+        # 不完整的帧不能按完整形状读取，否则会越过 SDK 缓冲区末尾
+        if stFrameInfo.nFrameLen < self._src_bytes:
+            raise HikCameraError(
+                f"帧数据不完整! 长度[{stFrameInfo.nFrameLen}] 需要[{self._src_bytes}]"
+            )
+
+        # 直接在 SDK 缓冲区上转换（不复制），
+        # 缓冲区在释放（或回调返回）之前保持有效
+        return self._converter(pData, stFrameInfo)
+
+    def _specialize(self, key: tuple) -> None:
+        """图像尺寸或像素格式变化时，重新选择转换方法并计算源数据与输出的形状
+
+        Args:
+            key: (高, 宽, 像素格式)
+        """
+        height, width, pixel_type = key
+        if pixel_type != self._pixel_type:
+            self._converter = self._select_converter(pixel_type)
+            self._pixel_type = pixel_type
+
+        if self._cv_conversion is not None:
+            channels = self._cv_conversion[0]
+            self._src_bytes = height * width * channels
         else:
+            channels = 1
+            self._src_bytes = 0
+        self._src_shape = (height, width) if channels == 1 else (height, width, channels)
+        if self._config.mono_as_gray and is_mono_format(pixel_type):
+            self._out_shape = (height, width)
+        else:
+            self._out_shape = (height, width, 3)
+        self._last_shape = key
+
+    def _select_converter(self, pixel_type: int):
+        """按像素格式选择专用转换方法
+
+        Returns:
+            签名为 (pData, stFrameInfo) -> np.ndarray 的绑定方法
+        """
+        self._cv_conversion = _CONVERT_TABLE.get(pixel_type)
+        self._bayer_meta = get_bayer_meta(pixel_type)
+        self._sdk_convert_ok = False
+
+        # 单色格式直接输出灰度图
+        if self._config.mono_as_gray and is_mono_format(pixel_type):
+            if pixel_type == PixelType_Gvsp_Mono8:
+                return self._convert_gray
+            return self._convert_sdk_gray
+
+        # BGR 无需转换
+        if self._cv_conversion is not None and self._cv_conversion[1] is None:
+            return self._convert_copy
+
+        # 8 位 Bayer + 白平衡增益使用融合内核
+        if self._config.fused_wb is not None and pixel_type in _BAYER8_FORMATS:
+            self._bayer_red_offset = BAYER_RED_OFFSET[self._bayer_meta[0]]
+            return self._convert_fused
+
+        return self._convert_sdk
+
+    def _convert_gray(self, pData, stFrameInfo: MV_FRAME_OUT_INFO_EX) -> np.ndarray:
+        """Mono8 数据直接复制到灰度输出缓冲区"""
+        gray_out = self._get_frame_out(self._out_shape)
+        np.copyto(gray_out, np.ctypeslib.as_array(pData, shape=self._src_shape))
+        return gray_out
+
+    def _convert_sdk_gray(self, pData, stFrameInfo: MV_FRAME_OUT_INFO_EX) -> np.ndarray:
+        """高位深单色格式使用 SDK 转换为 Mono8 灰度"""
+        gray_out = self._get_frame_out(self._out_shape)
+        if not self._sdk_convert(pData, stFrameInfo, gray_out, PixelType_Gvsp_Mono8):
             raise HikCameraError(
-                f"不支持的像素格式: {get_pixel_format_name(pixel_type)}"
+                f"像素格式转换失败: {get_pixel_format_name(stFrameInfo.enPixelType)}"
             )
+        return gray_out
+
+    def _convert_copy(self, pData, stFrameInfo: MV_FRAME_OUT_INFO_EX) -> np.ndarray:
+        """BGR 数据直接复制到输出缓冲区"""
+        bgr_out = self._get_frame_out(self._out_shape)
+        np.copyto(bgr_out, np.ctypeslib.as_array(pData, shape=self._src_shape))
+        return bgr_out
+
+    def _convert_fused(self, pData, stFrameInfo: MV_FRAME_OUT_INFO_EX) -> np.ndarray:
+        """8 位 Bayer 一次遍历完成去马赛克与白平衡增益"""
+        bgr_out = self._get_frame_out(self._out_shape)
+        red_y, red_x = self._bayer_red_offset
+        r_gain, g_gain, b_gain = self._config.fused_wb
+        bayer_to_bgr_fused(np.ctypeslib.as_array(pData, shape=self._src_shape), bgr_out,
+                           red_y, red_x, r_gain, g_gain, b_gain)
+        return bgr_out
+
+    def _convert_sdk(self, pData, stFrameInfo: MV_FRAME_OUT_INFO_EX) -> np.ndarray:
+        """使用 SDK 内置的像素格式转换，失败时改用 OpenCV 转换"""
+        bgr_out = self._get_frame_out(self._out_shape)
+        if self._sdk_convert(pData, stFrameInfo, bgr_out, PixelType_Gvsp_BGR8_Packed):
+            self._sdk_convert_ok = True
+            return bgr_out
+
+        if self._cv_conversion is None:
+            raise HikCameraError(
+                f"不支持的像素格式: {get_pixel_format_name(stFrameInfo.enPixelType)}"
+            )
+
+        # SDK 从未成功转换过该格式，视为不支持，之后的帧直接使用 OpenCV 转换；
+        # 成功过则只是本帧的偶发失败，本帧改用 OpenCV，下一帧仍先尝试 SDK
+        if not self._sdk_convert_ok:
+            self._converter = self._convert_cv
+        return self._convert_cv(pData, stFrameInfo)
+
+    def _convert_cv(self, pData, stFrameInfo: MV_FRAME_OUT_INFO_EX) -> np.ndarray:
+        """使用 OpenCV 转换为 BGR"""
+        bgr_out = self._get_frame_out(self._out_shape)
+        cv2.cvtColor(np.ctypeslib.as_array(pData, shape=self._src_shape),
+                     self._cv_conversion[1], dst=bgr_out)
+        return bgr_out
+
+    def _get_frame_out(self, shape: tuple) -> np.ndarray:
+        """获取复用的输出缓冲区，仅在形状变化时重新分配"""
+        if self._frame_out is None or self._frame_out.shape != shape:
+            self._frame_out = np.empty(shape, dtype=np.uint8)
+        return self._frame_out
+
+    def _sdk_convert(self, pData, stFrameInfo: MV_FRAME_OUT_INFO_EX,
+                     dst: np.ndarray, dst_pixel_type: int) -> bool:
+        """使用 SDK 的 MV_CC_ConvertPixelTypeEx 转换像素格式
+
+        Args:
+            pData: SDK 图像缓冲区指针
+            stFrameInfo: 帧信息
+            dst: 输出缓冲区，与目标像素格式大小一致的连续 uint8 数组
+            dst_pixel_type: 目标像素格式
 
-        return image
+        Returns:
+            转换是否成功
+        """
+        stConvertParam = MV_CC_PIXEL_CONVERT_PARAM_EX()
+        memset(byref(stConvertParam), 0, sizeof(stConvertParam))
+        stConvertParam.nWidth = stFrameInfo.nWidth
+        stConvertParam.nHeight = stFrameInfo.nHeight
+        stConvertParam.enSrcPixelType = stFrameInfo.enPixelType
+        stConvertParam.pSrcData = pData
+        stConvertParam.nSrcDataLen = stFrameInfo.nFrameLen
+        stConvertParam.enDstPixelType = dst_pixel_type
+        stConvertParam.pDstBuffer = dst.ctypes.data_as(POINTER(c_ubyte))
+        stConvertParam.nDstBufferSize = dst.nbytes
+
+        return self._cam.MV_CC_ConvertPixelTypeEx(stConvertParam) == 0
 
     def close(self) -> None:
-        """关闭相机，释放资源"""
-        global _SDK_INITIALIZED, _SDK_INIT_COUNT
+        """关闭相机，释放资源
 
+        SDK 本身保持初始化状态，在解释器退出时先关闭仍打开的相机再统一反初始化。
+        """
         if self._is_running:
             self.stop()
 
@@ -320,12 +788,7 @@ class HikCamera:
             except:
                 pass
             self._cam = None
-
-        # 反初始化 SDK（全局唯一）
-        _SDK_INIT_COUNT -= 1
-        if _SDK_INIT_COUNT <= 0:
-            MvCamera.MV_CC_Finalize()
-            _SDK_INITIALIZED = False
+        _LIVE_CAMERAS.discard(self)
 
     def __enter__(self):
         """上下文管理器入口"""
@@ -336,38 +799,31 @@ class HikCamera:
         self.close()
         return False
 
-    def __del__(self):
-        """析构函数"""
-        try:
-            self.close()
-        except:
-            pass
-
     # ============ 属性 ============
 
     @property
     def width(self) -> int:
         """获取图像宽度"""
-        return self._config.width
+        return self._get_width()
 
     @width.setter
     def width(self, value: int) -> None:
         """设置图像宽度"""
-        self._config.width = value
-        ret = self._cam.MV_CC_SetIntValue("Width", value)
+        ret = self._set_int("Width", value)
+        self._param_cache.pop('width', None)
         if ret != 0:
             raise HikCameraError(f"设置 Width 失败! ret[0x{ret:x}]")
 
     @property
     def height(self) -> int:
         """获取图像高度"""
-        return self._config.height
+        return self._get_height()
 
     @height.setter
     def height(self, value: int) -> None:
         """设置图像高度"""
-        self._config.height = value
-        ret = self._cam.MV_CC_SetIntValue("Height", value)
+        ret = self._set_int("Height", value)
+        self._param_cache.pop('height', None)
         if ret != 0:
             raise HikCameraError(f"设置 Height 失败! ret[0x{ret:x}]")
 
@@ -391,12 +847,12 @@ class HikCamera:
     @exposure.setter
     def exposure(self, value: int) -> None:
         """设置曝光时间（微秒）"""
-        self._config.exposure = value
         # 使用浮点型设置（大多数相机支持）
-        ret = self._cam.MV_CC_SetFloatValue("ExposureTime", float(value))
+        ret = self._set_float("ExposureTime", float(value))
         if ret != 0:
             # 尝试使用整型设置
-            ret = self._cam.MV_CC_SetIntValue("ExposureTime", value)
+            ret = self._set_int("ExposureTime", value)
+        self._param_cache.pop('exposure', None)
         if ret != 0:
             raise HikCameraError(f"设置 ExposureTime 失败! ret[0x{ret:x}]")
 
@@ -412,12 +868,12 @@ class HikCamera:
     @gain.setter
     def gain(self, value: float) -> None:
         """设置增益"""
-        self._config.gain = value
         # 尝试使用 "Gain" 参数
-        ret = self._cam.MV_CC_SetFloatValue("Gain", value)
+        ret = self._set_float("Gain", value)
         if ret != 0:
             # 尝试使用 "AnalogGain" 参数
-            ret = self._cam.MV_CC_SetFloatValue("AnalogGain", value)
+            ret = self._set_float("AnalogGain", value)
+        self._param_cache.pop('gain', None)
         if ret != 0:
             print(f"警告: 设置增益失败 (ret=0x{ret:x})，增益可能不受支持")
             # 不抛出异常，只是警告
@@ -434,13 +890,13 @@ class HikCamera:
     @fps.setter
     def fps(self, value: float) -> None:
         """设置帧率"""
-        self._config.fps = int(value)
-        ret = self._cam.MV_CC_SetFloatValue("AcquisitionFrameRate", value)
+        ret = self._set_float("AcquisitionFrameRate", value)
+        self._param_cache.pop('fps', None)
         if ret != 0:
             raise HikCameraError(f"设置 AcquisitionFrameRate 失败! ret[0x{ret:x}]")
 
     @property
-    def device_info(self) -> Optional[Dict[str, Any]]:
+    def device_info(self) -> Optional[DeviceInfo]:
         """获取设备信息"""
         return self._device_info
 
@@ -457,13 +913,16 @@ class HikCamera:
     @property
     def trigger_mode(self) -> str:
         """获取触发模式"""
-        return self._config.trigger_mode
+        return self._state['trigger_mode']
 
     # ============ 参数查询与设置 ============
 
     def get_params(self) -> CameraParams:
         """获取相机关键参数
 
+        参数值优先从缓存读取，只有缓存未命中时才查询 SDK。
+        相机自动调整过参数时，可先调用 refresh_params() 获取最新值。
+
         Returns:
             CameraParams 对象，包含所有关键参数
         """
@@ -522,13 +981,9 @@ class HikCamera:
         if trigger_mode is not None:
             if trigger_mode not in ("continuous", "trigger"):
                 raise HikCameraError(f"无效的触发模式: {trigger_mode}")
-            self._config.trigger_mode = trigger_mode
+            self._state['trigger_mode'] = trigger_mode
             # 实时更新触发模式
-            if trigger_mode == "trigger":
-                self._cam.MV_CC_SetEnumValue("TriggerMode", MV_TRIGGER_MODE_ON)
-                self._cam.MV_CC_SetEnumValue("TriggerSource", MV_TRIGGER_SOURCE_SOFTWARE)
-            else:
-                self._cam.MV_CC_SetEnumValue("TriggerMode", MV_TRIGGER_MODE_OFF)
+            self._apply_trigger_mode(trigger_mode)
 
         if offset_x is not None:
             self._set_offset_x(offset_x)
@@ -536,7 +991,67 @@ class HikCamera:
         if offset_y is not None:
             self._set_offset_y(offset_y)
 
+    def refresh_params(self) -> None:
+        """清空参数缓存，下次读取参数时重新从相机查询
+
+        相机可能自行调整部分参数（例如 ROI 对齐后的实际宽高、
+        自动曝光下的帧率），需要最新值时调用此方法。
+        同时清空节点写入缓存，之后的设置一定会下发到相机。
+        """
+        self._param_cache.clear()
+        self._node_cache.clear()
+
+    def _cached_param(self, key: str, query) -> Any:
+        """读取参数缓存，未命中时调用 query 查询 SDK 并写入缓存"""
+        if key not in self._param_cache:
+            self._param_cache[key] = query()
+        return self._param_cache[key]
+
+    def _get_width(self) -> int:
+        """获取图像宽度（优先读取缓存）"""
+        return self._cached_param('width', self._query_width)
+
+    def _get_height(self) -> int:
+        """获取图像高度（优先读取缓存）"""
+        return self._cached_param('height', self._query_height)
+
     def _get_exposure(self) -> float:
+        """获取曝光时间（优先读取缓存）"""
+        return self._cached_param('exposure', self._query_exposure)
+
+    def _get_gain(self) -> float:
+        """获取增益（优先读取缓存）"""
+        return self._cached_param('gain', self._query_gain)
+
+    def _get_fps(self) -> float:
+        """获取帧率（优先读取缓存）"""
+        return self._cached_param('fps', self._query_fps)
+
+    def _get_offset_x(self) -> int:
+        """获取水平偏移（优先读取缓存）"""
+        return self._cached_param('offset_x', self._query_offset_x)
+
+    def _get_offset_y(self) -> int:
+        """获取垂直偏移（优先读取缓存）"""
+        return self._cached_param('offset_y', self._query_offset_y)
+
+    def _query_width(self) -> int:
+        """查询图像宽度，失败时返回配置值"""
+        stParam = MVCC_INTVALUE()
+        ret = self._cam.MV_CC_GetIntValue("Width", stParam)
+        if ret == 0:
+            return stParam.nCurValue
+        return self._config.width
+
+    def _query_height(self) -> int:
+        """查询图像高度，失败时返回配置值"""
+        stParam = MVCC_INTVALUE()
+        ret = self._cam.MV_CC_GetIntValue("Height", stParam)
+        if ret == 0:
+            return stParam.nCurValue
+        return self._config.height
+
+    def _query_exposure(self) -> float:
         """获取曝光时间"""
         stFloatParam = MVCC_FLOATVALUE()
         ret = self._cam.MV_CC_GetFloatValue("ExposureTime", stFloatParam)
@@ -549,7 +1064,7 @@ class HikCamera:
             return float(stIntParam.nCurValue)
         return 0.0
 
-    def _get_gain(self) -> float:
+    def _query_gain(self) -> float:
         """获取增益"""
         stParam = MVCC_FLOATVALUE()
         ret = self._cam.MV_CC_GetFloatValue("Gain", stParam)
@@ -557,7 +1072,7 @@ class HikCamera:
             return stParam.fCurValue
         return 0.0
 
-    def _get_fps(self) -> float:
+    def _query_fps(self) -> float:
         """获取帧率"""
         stParam = MVCC_FLOATVALUE()
         ret = self._cam.MV_CC_GetFloatValue("AcquisitionFrameRate", stParam)
@@ -565,7 +1080,7 @@ class HikCamera:
             return stParam.fCurValue
         return 0.0
 
-    def _get_offset_x(self) -> int:
+    def _query_offset_x(self) -> int:
         """获取水平偏移"""
         stParam = MVCC_INTVALUE()
         ret = self._cam.MV_CC_GetIntValue("OffsetX", stParam)
@@ -573,7 +1088,7 @@ class HikCamera:
             return stParam.nCurValue
         return 0
 
-    def _get_offset_y(self) -> int:
+    def _query_offset_y(self) -> int:
         """获取垂直偏移"""
         stParam = MVCC_INTVALUE()
         ret = self._cam.MV_CC_GetIntValue("OffsetY", stParam)
@@ -581,30 +1096,73 @@ class HikCamera:
             return stParam.nCurValue
         return 0
 
+    def _apply_trigger_mode(self, trigger_mode: str) -> None:
+        """将触发模式写入相机，触发模式下使用软件触发源"""
+        if trigger_mode == "trigger":
+            self._set_enum("TriggerMode", MV_TRIGGER_MODE_ON)
+            self._set_enum("TriggerSource", MV_TRIGGER_SOURCE_SOFTWARE)
+        else:
+            self._set_enum("TriggerMode", MV_TRIGGER_MODE_OFF)
+
+    def _set_node(self, setter, name: str, value) -> int:
+        """写入节点值，与最近一次成功写入的值相同时跳过 SDK 调用
+
+        Returns:
+            SDK 返回码，跳过时为 0
+        """
+        if self._node_cache.get(name) == value:
+            return 0
+        ret = setter(name, value)
+        if ret == 0:
+            self._node_cache[name] = value
+        else:
+            self._node_cache.pop(name, None)
+        return ret
+
+    def _set_enum(self, name: str, value: int) -> int:
+        """设置枚举节点"""
+        return self._set_node(self._cam.MV_CC_SetEnumValue, name, value)
+
+    def _set_int(self, name: str, value: int) -> int:
+        """设置整型节点"""
+        return self._set_node(self._cam.MV_CC_SetIntValue, name, value)
+
+    def _set_float(self, name: str, value: float) -> int:
+        """设置浮点型节点"""
+        return self._set_node(self._cam.MV_CC_SetFloatValue, name, value)
+
     def _set_offset_x(self, value: int) -> None:
         """设置水平偏移"""
-        ret = self._cam.MV_CC_SetIntValue("OffsetX", value)
+        ret = self._set_int("OffsetX", value)
+        self._param_cache.pop('offset_x', None)
         if ret != 0:
             raise HikCameraError(f"设置 OffsetX 失败! ret[0x{ret:x}]")
 
     def _set_offset_y(self, value: int) -> None:
         """设置垂直偏移"""
-        ret = self._cam.MV_CC_SetIntValue("OffsetY", value)
+        ret = self._set_int("OffsetY", value)
+        self._param_cache.pop('offset_y', None)
         if ret != 0:
             raise HikCameraError(f"设置 OffsetY 失败! ret[0x{ret:x}]")
 
     # ============ 静态方法 ============
 
     @staticmethod
-    def list_devices() -> list:
+    def list_devices() -> List[DeviceInfo]:
         """列出所有可用的设备
 
         Returns:
-            设备信息字典列表
+            DeviceInfo 列表
         """
-        return enumerate_devices()
+        return device_list()
 
 
-def device_list() -> list:
-    """列出所有可用的海康相机设备（快捷函数）"""
-    return enumerate_devices()
+def device_list(tlayer_type: int = DEVICE_TYPES_ALL, force: bool = False) -> List[DeviceInfo]:
+    """列出所有可用的海康相机设备（快捷函数）
+
+    Args:
+        tlayer_type: 要枚举的传输层类型，默认全部（见 enumerate_devices）
+        force: 为 True 时忽略枚举缓存，重新扫描设备
+    """
+    _ensure_sdk_initialized()
+    return enumerate_devices(tlayer_type, force)
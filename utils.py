@@ -4,9 +4,17 @@
 import sys
 import platform
 import os
+import importlib
+import importlib.util
+import socket
+import struct
+import threading
+import time
 from ctypes import *
 from typing import Optional, Tuple, List
 
+from .config import DeviceInfo
+
 # 兼容不同操作系统加载动态库
 currentsystem = platform.system()
 if currentsystem == 'Windows':
@@ -14,10 +22,98 @@ if currentsystem == 'Windows':
 else:
     mvs_path = "/opt/MVS/Samples/64/Python/MvImport"
 
-if mvs_path not in sys.path:
-    sys.path.append(mvs_path)
-
-from MvCameraControl_class import *
+# MvImport 下的 SDK 模块，按依赖顺序排列。这些模块直接从文件加载并注册到
+# sys.modules，不把 mvs_path 加入 sys.path（否则进程内之后每次 import 都要多扫描
+# 一个目录）；模块之间的 "from X import *" 会直接命中 sys.modules
+_SDK_MODULES = (
+    'PixelType_header',
+    'CameraParams_const',
+    'CameraParams_header',
+    'MvErrorDefine_const',
+    'MvISPErrorDefine_const',
+    'MvCameraControl_class',
+)
+
+
+def _load_sdk_module(name: str):
+    """从 mvs_path 加载一个 SDK 模块并注册到 sys.modules（只加载一次）"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.spec_from_file_location(name, os.path.join(mvs_path, name + ".py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+_load_sdk_module('PixelType_header')
+_load_sdk_module('CameraParams_const')
+
+# 模块级只导入轻量的常量定义；MvCameraControl_class 会加载 SDK 动态库并定义
+# 全部 ctypes 结构体，推迟到第一次枚举设备时再导入（见 _mvs）
+from PixelType_header import (
+    PixelType_Gvsp_Undefined,
+    PixelType_Gvsp_Mono8,
+    PixelType_Gvsp_Mono10,
+    PixelType_Gvsp_Mono10_Packed,
+    PixelType_Gvsp_Mono12,
+    PixelType_Gvsp_Mono12_Packed,
+    PixelType_Gvsp_Mono16,
+    PixelType_Gvsp_BayerGR8,
+    PixelType_Gvsp_BayerRG8,
+    PixelType_Gvsp_BayerGB8,
+    PixelType_Gvsp_BayerBG8,
+    PixelType_Gvsp_BayerGR10,
+    PixelType_Gvsp_BayerRG10,
+    PixelType_Gvsp_BayerGB10,
+    PixelType_Gvsp_BayerBG10,
+    PixelType_Gvsp_BayerGR10_Packed,
+    PixelType_Gvsp_BayerRG10_Packed,
+    PixelType_Gvsp_BayerGB10_Packed,
+    PixelType_Gvsp_BayerBG10_Packed,
+    PixelType_Gvsp_BayerGR12,
+    PixelType_Gvsp_BayerRG12,
+    PixelType_Gvsp_BayerGB12,
+    PixelType_Gvsp_BayerBG12,
+    PixelType_Gvsp_BayerGR12_Packed,
+    PixelType_Gvsp_BayerRG12_Packed,
+    PixelType_Gvsp_BayerGB12_Packed,
+    PixelType_Gvsp_BayerBG12_Packed,
+    PixelType_Gvsp_RGB8_Packed,
+    PixelType_Gvsp_BGR8_Packed,
+    PixelType_Gvsp_RGBA8_Packed,
+    PixelType_Gvsp_BGRA8_Packed,
+    PixelType_Gvsp_YUV422_Packed,
+    PixelType_Gvsp_YUV422_YUYV_Packed,
+)
+from CameraParams_const import (
+    MV_GIGE_DEVICE,
+    MV_GENTL_GIGE_DEVICE,
+    MV_USB_DEVICE,
+    MV_GENTL_CAMERALINK_DEVICE,
+    MV_GENTL_CXP_DEVICE,
+    MV_GENTL_XOF_DEVICE,
+)
+
+# 可选的 Cython 扩展：直接在 C 结构体上读取枚举结果，未编译时使用 ctypes
+try:
+    from . import _hik_fast
+except ImportError:
+    _hik_fast = None
+
+
+# decoding_char 对非 ASCII 字符串依次尝试的编码，都失败时按 latin-1 解码（不会失败）
+_DECODE_ENCODINGS = ('gbk', 'utf-8')
+
+# 上一次成功解码非 ASCII 字符串的编码。同一设备固件输出的编码是固定的，
+# 之后优先尝试它，避免每个字段都先抛出一次 UnicodeDecodeError
+_HIK_ENCODING = None
 
 
 def decoding_char(ctypes_char_array) -> str:
@@ -25,194 +121,396 @@ def decoding_char(ctypes_char_array) -> str:
 
     适用于 Python 2.x 和 3.x，以及 32/64 位环境。
     """
-    byte_str = memoryview(ctypes_char_array).tobytes()
-
-    # 在第一个空字符处截断
-    null_index = byte_str.find(b'\x00')
-    if null_index != -1:
-        byte_str = byte_str[:null_index]
+    global _HIK_ENCODING
+
+    # 空数组没有末尾元素可检查
+    if len(ctypes_char_array) == 0:
+        return ""
+
+    try:
+        if ctypes_char_array[-1] in (0, b'\x00'):
+            # 数组以空字符结尾时 strlen 一定在数组内停止，按 C 字符串读取，只复制有效部分
+            byte_str = cast(ctypes_char_array, c_char_p).value or b''
+        else:
+            # 字符串占满整个数组，没有结尾空字符：复制整个数组并在第一个空字符处截断
+            byte_str = bytes(ctypes_char_array).split(b'\x00', 1)[0]
+    except (ArgumentError, TypeError):
+        # 不能转换为指针的缓冲区对象（如 bytearray）
+        byte_str = memoryview(ctypes_char_array).tobytes().split(b'\x00', 1)[0]
+
+    # 型号、序列号绝大多数是纯 ASCII，先走快速路径
+    try:
+        return byte_str.decode('ascii')
+    except UnicodeDecodeError:
+        pass
+
+    if _HIK_ENCODING is not None:
+        try:
+            return byte_str.decode(_HIK_ENCODING)
+        except UnicodeDecodeError:
+            pass
 
     # 多编码尝试解码
-    for encoding in ['gbk', 'utf-8', 'latin-1']:
+    for encoding in _DECODE_ENCODINGS:
+        if encoding == _HIK_ENCODING:
+            continue
         try:
-            return byte_str.decode(encoding)
+            text = byte_str.decode(encoding)
         except UnicodeDecodeError:
             continue
+        _HIK_ENCODING = encoding
+        return text
+
+    # 如果所有编码都失败，使用 latin-1（任意字节都可解码）
+    return byte_str.decode('latin-1')
+
 
-    # 如果所有编码都失败，使用替换策略
-    return byte_str.decode('latin-1', errors='replace')
+_MVS_MODULE = None
+
+
+def _mvs():
+    """按需导入并返回 MvCameraControl_class 模块（只导入一次）"""
+    global _MVS_MODULE
+    if _MVS_MODULE is None:
+        # 不同 SDK 版本包含的模块略有差异，不存在的依赖跳过
+        for name in _SDK_MODULES[:-1]:
+            if os.path.isfile(os.path.join(mvs_path, name + ".py")):
+                _load_sdk_module(name)
+        try:
+            _MVS_MODULE = _load_sdk_module('MvCameraControl_class')
+        except ModuleNotFoundError:
+            # SDK 新增了上表之外的依赖，退回到 sys.path 方式导入
+            if mvs_path not in sys.path:
+                sys.path.append(mvs_path)
+            _MVS_MODULE = importlib.import_module('MvCameraControl_class')
+    return _MVS_MODULE
+
+
+# 传输层类型 -> 设备类型字符串
+_TLAYER_TYPE_NAMES = {
+    MV_GIGE_DEVICE: "GigE",
+    MV_GENTL_GIGE_DEVICE: "GigE",
+    MV_USB_DEVICE: "USB3 Vision",
+    MV_GENTL_CAMERALINK_DEVICE: "CameraLink",
+    MV_GENTL_CXP_DEVICE: "CoaXPress",
+    MV_GENTL_XOF_DEVICE: "XoF",
+}
 
 
 def get_device_type_string(n_tlayer_type: int) -> str:
     """获取设备类型字符串"""
-    if n_tlayer_type == MV_GIGE_DEVICE or n_tlayer_type == MV_GENTL_GIGE_DEVICE:
-        return "GigE"
-    elif n_tlayer_type == MV_USB_DEVICE:
-        return "USB3 Vision"
-    elif n_tlayer_type == MV_GENTL_CAMERALINK_DEVICE:
-        return "CameraLink"
-    elif n_tlayer_type == MV_GENTL_CXP_DEVICE:
-        return "CoaXPress"
-    elif n_tlayer_type == MV_GENTL_XOF_DEVICE:
-        return "XoF"
-    else:
-        return "Unknown"
+    return _TLAYER_TYPE_NAMES.get(n_tlayer_type, "Unknown")
+
+
+# 传输层类型 -> (SpecialInfo 中的子结构体名, 是否有 IP 地址)
+_TLAYER_DISPATCH = {
+    MV_GIGE_DEVICE: ("stGigEInfo", True),
+    MV_GENTL_GIGE_DEVICE: ("stGigEInfo", True),
+    MV_USB_DEVICE: ("stUsb3VInfo", False),
+    MV_GENTL_CAMERALINK_DEVICE: ("stCMLInfo", False),
+    MV_GENTL_CXP_DEVICE: ("stCXPInfo", False),
+    MV_GENTL_XOF_DEVICE: ("stXoFInfo", False),
+}
 
 
-def get_device_info(mvcc_dev_info) -> dict:
-    """从设备信息对象提取设备信息字典
+def get_device_info(mvcc_dev_info) -> DeviceInfo:
+    """从设备信息对象提取设备信息
 
     Args:
         mvcc_dev_info: MV_CC_DEVICE_INFO 对象或指针
     """
     # 如果是指针，获取其内容
     if hasattr(mvcc_dev_info, 'contents'):
-        mvcc_dev_info = mvcc_dev_info.contents
+        return _get_device_info_from_ptr(mvcc_dev_info)
+    return _get_device_info_from_struct(mvcc_dev_info)
 
+
+def _get_device_info_from_ptr(p_dev_info, index: int = -1) -> DeviceInfo:
+    """从 POINTER(MV_CC_DEVICE_INFO) 提取设备信息"""
+    return _get_device_info_from_struct(p_dev_info.contents, index)
+
+
+def _get_device_info_from_struct(mvcc_dev_info, index: int = -1) -> DeviceInfo:
+    """从 MV_CC_DEVICE_INFO 结构体提取设备信息"""
     device_type = get_device_type_string(mvcc_dev_info.nTLayerType)
+    model_name = ""
+    serial_number = ""
+    ip_address = None
 
-    info = {
-        "index": -1,
-        "type": device_type,
-        "model_name": "",
-        "serial_number": "",
-        "ip_address": None,
-    }
+    dispatch = _TLAYER_DISPATCH.get(mvcc_dev_info.nTLayerType)
+    if dispatch is not None:
+        attr, has_ip = dispatch
+        sub_info = getattr(mvcc_dev_info.SpecialInfo, attr)
+        model_name = decoding_char(sub_info.chModelName)
+        serial_number = decoding_char(sub_info.chSerialNumber)
+        if has_ip:
+            # 解析 IP 地址（nCurrentIp 高字节为第一段）
+            ip_address = socket.inet_ntoa(struct.pack('>I', sub_info.nCurrentIp & 0xFFFFFFFF))
 
-    if mvcc_dev_info.nTLayerType == MV_GIGE_DEVICE or mvcc_dev_info.nTLayerType == MV_GENTL_GIGE_DEVICE:
-        info["model_name"] = decoding_char(mvcc_dev_info.SpecialInfo.stGigEInfo.chModelName)
-        # 解析 IP 地址
-        ip = mvcc_dev_info.SpecialInfo.stGigEInfo.nCurrentIp
-        info["ip_address"] = f"{(ip >> 24) & 0xFF}.{(ip >> 16) & 0xFF}.{(ip >> 8) & 0xFF}.{ip & 0xFF}"
+    return DeviceInfo(index, device_type, model_name, serial_number, ip_address)
 
-    elif mvcc_dev_info.nTLayerType == MV_USB_DEVICE:
-        info["model_name"] = decoding_char(mvcc_dev_info.SpecialInfo.stUsb3VInfo.chModelName)
-        info["serial_number"] = decoding_char(mvcc_dev_info.SpecialInfo.stUsb3VInfo.chSerialNumber)
 
-    elif mvcc_dev_info.nTLayerType == MV_GENTL_CAMERALINK_DEVICE:
-        info["model_name"] = decoding_char(mvcc_dev_info.SpecialInfo.stCMLInfo.chModelName)
-        info["serial_number"] = decoding_char(mvcc_dev_info.SpecialInfo.stCMLInfo.chSerialNumber)
+# 设备枚举结果缓存：GigE 枚举需要网络广播，耗时可达数百毫秒，
+# 短时间内重复枚举（如 device_list() 后紧接着打开相机）直接复用上次结果。
+# deviceList 中的设备信息指针只在下一次枚举前有效，因此只保留最近一次枚举
+ENUM_CACHE_TTL = 2.0
 
-    elif mvcc_dev_info.nTLayerType == MV_GENTL_CXP_DEVICE:
-        info["model_name"] = decoding_char(mvcc_dev_info.SpecialInfo.stCXPInfo.chModelName)
-        info["serial_number"] = decoding_char(mvcc_dev_info.SpecialInfo.stCXPInfo.chSerialNumber)
+# 常用的传输层类型组合。GigE 枚举需要网络发现，耗时远超其他传输层，
+# 只使用 USB 相机的主机传入 DEVICE_TYPES_USB 可以省掉这部分时间
+DEVICE_TYPES_USB = MV_USB_DEVICE
+DEVICE_TYPES_GIGE = MV_GIGE_DEVICE
+DEVICE_TYPES_ALL = (MV_GIGE_DEVICE | MV_USB_DEVICE | MV_GENTL_CAMERALINK_DEVICE
+                    | MV_GENTL_CXP_DEVICE | MV_GENTL_XOF_DEVICE)
 
-    elif mvcc_dev_info.nTLayerType == MV_GENTL_XOF_DEVICE:
-        info["model_name"] = decoding_char(mvcc_dev_info.SpecialInfo.stXoFInfo.chModelName)
-        info["serial_number"] = decoding_char(mvcc_dev_info.SpecialInfo.stXoFInfo.chSerialNumber)
+_ENUM_CACHE = {'ts': 0.0, 'tlayer_type': None, 'list': None, 'devices': None}
+_ENUM_LOCK = threading.Lock()
 
-    return info
 
+def enum_device_list(tlayer_type: int = DEVICE_TYPES_ALL,
+                     force: bool = False) -> Tuple[int, Optional['MV_CC_DEVICE_INFO_LIST']]:
+    """枚举设备并返回原始 MV_CC_DEVICE_INFO_LIST（带缓存）
 
-def enumerate_devices() -> List[dict]:
-    """枚举所有可用的海康相机设备
+    Args:
+        tlayer_type: 要枚举的传输层类型（MV_*_DEVICE 按位或）
+        force: 为 True 时忽略缓存，重新枚举
+
+    Returns:
+        (ret, deviceList)，ret 非 0 时 deviceList 为 None
+    """
+    with _ENUM_LOCK:
+        if (not force and _ENUM_CACHE['list'] is not None
+                and _ENUM_CACHE['tlayer_type'] == tlayer_type
+                and time.time() - _ENUM_CACHE['ts'] < ENUM_CACHE_TTL):
+            return 0, _ENUM_CACHE['list']
+
+        _ENUM_CACHE['list'] = None
+        _ENUM_CACHE['devices'] = None
+
+        mvs = _mvs()
+        deviceList = mvs.MV_CC_DEVICE_INFO_LIST()
+        ret = mvs.MvCamera.MV_CC_EnumDevices(tlayer_type, deviceList)
+        if ret != 0:
+            return ret, None
+
+        _ENUM_CACHE['ts'] = time.time()
+        _ENUM_CACHE['tlayer_type'] = tlayer_type
+        _ENUM_CACHE['list'] = deviceList
+        return 0, deviceList
+
+
+def invalidate_device_cache() -> None:
+    """清除设备枚举缓存，下次枚举时重新扫描"""
+    with _ENUM_LOCK:
+        _ENUM_CACHE['list'] = None
+        _ENUM_CACHE['devices'] = None
+
+
+def find_device_by_serial(deviceList, serial: str):
+    """在枚举结果中按序列号查找设备
 
     Returns:
-        设备信息字典列表
+        MV_CC_DEVICE_INFO 对象，未找到时返回 None
     """
-    deviceList = MV_CC_DEVICE_INFO_LIST()
-    tlayerType = (MV_GIGE_DEVICE | MV_USB_DEVICE | MV_GENTL_CAMERALINK_DEVICE
-                  | MV_GENTL_CXP_DEVICE | MV_GENTL_XOF_DEVICE)
+    device_info_ptr = POINTER(_mvs().MV_CC_DEVICE_INFO)
+    for i in range(deviceList.nDeviceNum):
+        mvcc_dev_info = cast(deviceList.pDeviceInfo[i], device_info_ptr).contents
+        if _get_device_info_from_struct(mvcc_dev_info).serial_number == serial:
+            return mvcc_dev_info
+    return None
 
-    ret = MvCamera.MV_CC_EnumDevices(tlayerType, deviceList)
+
+def enumerate_devices(tlayer_type: int = DEVICE_TYPES_ALL,
+                      force: bool = False) -> List[DeviceInfo]:
+    """枚举所有可用的海康相机设备
+
+    ENUM_CACHE_TTL 秒内的重复调用直接返回缓存结果（列表为副本，调用方可以随意修改）。
+
+    Args:
+        tlayer_type: 要枚举的传输层类型（MV_*_DEVICE 按位或），默认全部。
+            GigE 发现最耗时，仅使用 USB 相机时传入 DEVICE_TYPES_USB
+        force: 为 True 时忽略缓存，重新枚举
+
+    Returns:
+        DeviceInfo 列表
+    """
+    ret, deviceList = enum_device_list(tlayer_type, force)
     if ret != 0:
         raise RuntimeError(f"枚举设备失败! ret[0x{ret:x}]")
 
+    with _ENUM_LOCK:
+        if _ENUM_CACHE['list'] is deviceList and _ENUM_CACHE['devices'] is not None:
+            return list(_ENUM_CACHE['devices'])
+
     devices = []
-    for i in range(deviceList.nDeviceNum):
-        mvcc_dev_info = cast(deviceList.pDeviceInfo[i], POINTER(MV_CC_DEVICE_INFO)).contents
-        info = get_device_info(mvcc_dev_info)
-        info["index"] = i
-        devices.append(info)
-
-    return devices
-
-
-# Bayer 格式到 OpenCV 颜色转换码的映射
-# 海康相机的 Bayer 格式与 OpenCV 的定义对应关系
-BAYER_TO_COLOR_CODE = {
-    PixelType_Gvsp_BayerGR8: 0,   # BayerGR -> cv2.COLOR_BAYER_GR2BGR
-    PixelType_Gvsp_BayerRG8: 1,   # BayerRG -> cv2.COLOR_BAYER_RG2BGR
-    PixelType_Gvsp_BayerGB8: 2,   # BayerGB -> cv2.COLOR_BAYER_GB2BGR
-    PixelType_Gvsp_BayerBG8: 3,   # BayerBG -> cv2.COLOR_BAYER_BG2BGR
-    PixelType_Gvsp_BayerGR10: 0,
-    PixelType_Gvsp_BayerRG10: 1,
-    PixelType_Gvsp_BayerGB10: 2,
-    PixelType_Gvsp_BayerBG10: 3,
-    PixelType_Gvsp_BayerGR12: 0,
-    PixelType_Gvsp_BayerRG12: 1,
-    PixelType_Gvsp_BayerGB12: 2,
-    PixelType_Gvsp_BayerBG12: 3,
-    PixelType_Gvsp_BayerGR10_Packed: 0,
-    PixelType_Gvsp_BayerRG10_Packed: 1,
-    PixelType_Gvsp_BayerGB10_Packed: 2,
-    PixelType_Gvsp_BayerBG10_Packed: 3,
-    PixelType_Gvsp_BayerGR12_Packed: 0,
-    PixelType_Gvsp_BayerRG12_Packed: 1,
-    PixelType_Gvsp_BayerGB12_Packed: 2,
-    PixelType_Gvsp_BayerBG12_Packed: 3,
+    if _hik_fast is not None:
+        for i, (dev_tlayer_type, model_name, serial_number, ip) in enumerate(
+                _hik_fast.read_device_list(addressof(deviceList))):
+            devices.append(DeviceInfo(
+                i,
+                get_device_type_string(dev_tlayer_type),
+                decoding_char(model_name),
+                decoding_char(serial_number),
+                None if ip is None else socket.inet_ntoa(struct.pack('>I', ip)),
+            ))
+    else:
+        # 字段提取是持有 GIL 的纯 Python/ctypes 操作，多线程并不能加速，逐个提取即可
+        device_info_ptr = POINTER(_mvs().MV_CC_DEVICE_INFO)
+        for i in range(deviceList.nDeviceNum):
+            mvcc_dev_info = cast(deviceList.pDeviceInfo[i], device_info_ptr).contents
+            devices.append(_get_device_info_from_struct(mvcc_dev_info, i))
+
+    with _ENUM_LOCK:
+        if _ENUM_CACHE['list'] is deviceList:
+            _ENUM_CACHE['devices'] = devices
+    return list(devices)
+
+
+# Bayer 格式元数据: 像素格式 -> (颜色码, 位深, blue_last, start_green)
+# 颜色码按 PFNC/GenICam 命名表示 2x2 单元的排列（海康 BayerGR 即第一行 G R）：
+# 0: GR, 1: RG, 2: GB, 3: BG。OpenCV 旧式的 COLOR_BAYER_XX 常量按第二行命名，
+# 与之并不一致（BayerGR 对应 COLOR_BAYER_GB2BGR，见 hikcamera._BAYER_CV_CODES）。
+# blue_last: 蓝色像素位于 2x2 单元的第二行；start_green: 左上角像素为绿色。
+# 二者与 OpenCV 对相应转换码双线性去马赛克时的内部参数一致
+_BAYER_META = {
+    PixelType_Gvsp_BayerGR8: (0, 8, True, True),  # BayerGR -> cv2.COLOR_BayerGRBG2BGR
+    PixelType_Gvsp_BayerRG8: (1, 8, True, False),  # BayerRG -> cv2.COLOR_BayerRGGB2BGR
+    PixelType_Gvsp_BayerGB8: (2, 8, False, True),  # BayerGB -> cv2.COLOR_BayerGBRG2BGR
+    PixelType_Gvsp_BayerBG8: (3, 8, False, False),  # BayerBG -> cv2.COLOR_BayerBGGR2BGR
+    PixelType_Gvsp_BayerGR10: (0, 10, True, True),
+    PixelType_Gvsp_BayerRG10: (1, 10, True, False),
+    PixelType_Gvsp_BayerGB10: (2, 10, False, True),
+    PixelType_Gvsp_BayerBG10: (3, 10, False, False),
+    PixelType_Gvsp_BayerGR12: (0, 12, True, True),
+    PixelType_Gvsp_BayerRG12: (1, 12, True, False),
+    PixelType_Gvsp_BayerGB12: (2, 12, False, True),
+    PixelType_Gvsp_BayerBG12: (3, 12, False, False),
+    PixelType_Gvsp_BayerGR10_Packed: (0, 10, True, True),
+    PixelType_Gvsp_BayerRG10_Packed: (1, 10, True, False),
+    PixelType_Gvsp_BayerGB10_Packed: (2, 10, False, True),
+    PixelType_Gvsp_BayerBG10_Packed: (3, 10, False, False),
+    PixelType_Gvsp_BayerGR12_Packed: (0, 12, True, True),
+    PixelType_Gvsp_BayerRG12_Packed: (1, 12, True, False),
+    PixelType_Gvsp_BayerGB12_Packed: (2, 12, False, True),
+    PixelType_Gvsp_BayerBG12_Packed: (3, 12, False, False),
+}
+
+# Bayer 格式 -> 颜色码（2x2 单元排列，见 _BAYER_META；对应的 OpenCV 转换码由调用方映射）
+BAYER_TO_COLOR_CODE = {pixel_type: meta[0] for pixel_type, meta in _BAYER_META.items()}
+
+
+# 像素格式 -> 名称
+_PIXEL_FORMAT_NAMES = {
+    PixelType_Gvsp_Undefined: "Undefined",
+    PixelType_Gvsp_Mono8: "Mono8",
+    PixelType_Gvsp_Mono10: "Mono10",
+    PixelType_Gvsp_Mono10_Packed: "Mono10_Packed",
+    PixelType_Gvsp_Mono12: "Mono12",
+    PixelType_Gvsp_Mono12_Packed: "Mono12_Packed",
+    PixelType_Gvsp_Mono16: "Mono16",
+    PixelType_Gvsp_BayerGR8: "BayerGR8",
+    PixelType_Gvsp_BayerRG8: "BayerRG8",
+    PixelType_Gvsp_BayerGB8: "BayerGB8",
+    PixelType_Gvsp_BayerBG8: "BayerBG8",
+    PixelType_Gvsp_BayerGR10: "BayerGR10",
+    PixelType_Gvsp_BayerRG10: "BayerRG10",
+    PixelType_Gvsp_BayerGB10: "BayerGB10",
+    PixelType_Gvsp_BayerBG10: "BayerBG10",
+    PixelType_Gvsp_BayerGR10_Packed: "BayerGR10_Packed",
+    PixelType_Gvsp_BayerRG10_Packed: "BayerRG10_Packed",
+    PixelType_Gvsp_BayerGB10_Packed: "BayerGB10_Packed",
+    PixelType_Gvsp_BayerBG10_Packed: "BayerBG10_Packed",
+    PixelType_Gvsp_BayerGR12: "BayerGR12",
+    PixelType_Gvsp_BayerRG12: "BayerRG12",
+    PixelType_Gvsp_BayerGB12: "BayerGB12",
+    PixelType_Gvsp_BayerBG12: "BayerBG12",
+    PixelType_Gvsp_BayerGR12_Packed: "BayerGR12_Packed",
+    PixelType_Gvsp_BayerRG12_Packed: "BayerRG12_Packed",
+    PixelType_Gvsp_BayerGB12_Packed: "BayerGB12_Packed",
+    PixelType_Gvsp_BayerBG12_Packed: "BayerBG12_Packed",
+    PixelType_Gvsp_RGB8_Packed: "RGB8_Packed",
+    PixelType_Gvsp_BGR8_Packed: "BGR8_Packed",
+    PixelType_Gvsp_RGBA8_Packed: "RGBA8_Packed",
+    PixelType_Gvsp_BGRA8_Packed: "BGRA8_Packed",
+    PixelType_Gvsp_YUV422_Packed: "YUV422_Packed",
+    PixelType_Gvsp_YUV422_YUYV_Packed: "YUV422_YUYV_Packed",
 }
 
 
 def get_pixel_format_name(pixel_type: int) -> str:
     """获取像素格式名称"""
-    format_names = {
-        PixelType_Gvsp_Undefined: "Undefined",
-        PixelType_Gvsp_Mono8: "Mono8",
-        PixelType_Gvsp_Mono10: "Mono10",
-        PixelType_Gvsp_Mono10_Packed: "Mono10_Packed",
-        PixelType_Gvsp_Mono12: "Mono12",
-        PixelType_Gvsp_Mono12_Packed: "Mono12_Packed",
-        PixelType_Gvsp_Mono16: "Mono16",
-        PixelType_Gvsp_BayerGR8: "BayerGR8",
-        PixelType_Gvsp_BayerRG8: "BayerRG8",
-        PixelType_Gvsp_BayerGB8: "BayerGB8",
-        PixelType_Gvsp_BayerBG8: "BayerBG8",
-        PixelType_Gvsp_BayerGR10: "BayerGR10",
-        PixelType_Gvsp_BayerRG10: "BayerRG10",
-        PixelType_Gvsp_BayerGB10: "BayerGB10",
-        PixelType_Gvsp_BayerBG10: "BayerBG10",
-        PixelType_Gvsp_BayerGR10_Packed: "BayerGR10_Packed",
-        PixelType_Gvsp_BayerRG10_Packed: "BayerRG10_Packed",
-        PixelType_Gvsp_BayerGB10_Packed: "BayerGB10_Packed",
-        PixelType_Gvsp_BayerBG10_Packed: "BayerBG10_Packed",
-        PixelType_Gvsp_BayerGR12: "BayerGR12",
-        PixelType_Gvsp_BayerRG12: "BayerRG12",
-        PixelType_Gvsp_BayerGB12: "BayerGB12",
-        PixelType_Gvsp_BayerBG12: "BayerBG12",
-        PixelType_Gvsp_BayerGR12_Packed: "BayerGR12_Packed",
-        PixelType_Gvsp_BayerRG12_Packed: "BayerRG12_Packed",
-        PixelType_Gvsp_BayerGB12_Packed: "BayerGB12_Packed",
-        PixelType_Gvsp_BayerBG12_Packed: "BayerBG12_Packed",
-        PixelType_Gvsp_RGB8_Packed: "RGB8_Packed",
-        PixelType_Gvsp_BGR8_Packed: "BGR8_Packed",
-        PixelType_Gvsp_RGBA8_Packed: "RGBA8_Packed",
-        PixelType_Gvsp_BGRA8_Packed: "BGRA8_Packed",
-        PixelType_Gvsp_YUV422_Packed: "YUV422_Packed",
-        PixelType_Gvsp_YUV422_YUYV_Packed: "YUV422_YUYV_Packed",
-    }
-    return format_names.get(pixel_type, f"Unknown(0x{pixel_type:x})")
+    return _PIXEL_FORMAT_NAMES.get(pixel_type, f"Unknown(0x{pixel_type:x})")
+
+
+def _build_low_byte_table(table: dict) -> Optional[tuple]:
+    """按像素格式的低 8 位建立 256 项查找表
+
+    PFNC 编号中各 Bayer 格式的低 8 位互不相同，可以直接作为下标。
+    每项保存 (完整像素格式, 值)，查找时校验完整像素格式，排除其他格式的低 8 位碰撞。
+
+    Returns:
+        查找表；表内格式的低 8 位有重复时返回 None
+    """
+    slots = [None] * 256
+    for pixel_type, value in table.items():
+        low = pixel_type & 0xFF
+        if slots[low] is not None:
+            return None
+        slots[low] = (pixel_type, value)
+    return tuple(slots)
+
+
+# 低 8 位有重复（SDK 编号变化）时为 None，get_bayer_meta 回退到字典查找
+_BAYER_META_BY_LOW = _build_low_byte_table(_BAYER_META)
+
+
+def get_bayer_meta(pixel_type: int) -> Optional[Tuple[int, int, bool, bool]]:
+    """获取 Bayer 格式元数据
+
+    Returns:
+        (颜色码, 位深, blue_last, start_green)，非 Bayer 格式返回 None
+    """
+    if _BAYER_META_BY_LOW is None:
+        return _BAYER_META.get(pixel_type)
+    entry = _BAYER_META_BY_LOW[pixel_type & 0xFF]
+    if entry is not None and entry[0] == pixel_type:
+        return entry[1]
+    return None
+
+
+# Bayer 格式低 8 位的位图：对应位为 0 的像素格式一定不是 Bayer 格式
+_BAYER_LOW_MASK = sum(1 << low for low in {pixel_type & 0xFF for pixel_type in _BAYER_META})
 
 
 def is_bayer_format(pixel_type: int) -> bool:
     """判断是否为 Bayer 格式"""
+    # 位图快速排除；其他格式的低 8 位可能与 Bayer 格式相同，命中后再精确判断
+    if not (_BAYER_LOW_MASK >> (pixel_type & 0xFF)) & 1:
+        return False
     return pixel_type in BAYER_TO_COLOR_CODE
 
 
+_MONO_FORMATS = frozenset((
+    PixelType_Gvsp_Mono8,
+    PixelType_Gvsp_Mono10,
+    PixelType_Gvsp_Mono10_Packed,
+    PixelType_Gvsp_Mono12,
+    PixelType_Gvsp_Mono12_Packed,
+    PixelType_Gvsp_Mono16,
+))
+
+_RGB_FORMATS = frozenset((
+    PixelType_Gvsp_RGB8_Packed,
+    PixelType_Gvsp_BGR8_Packed,
+    PixelType_Gvsp_RGBA8_Packed,
+    PixelType_Gvsp_BGRA8_Packed,
+))
+
+
 def is_mono_format(pixel_type: int) -> bool:
     """判断是否为单色格式"""
-    mono_formats = [
-        PixelType_Gvsp_Mono8,
-        PixelType_Gvsp_Mono10,
-        PixelType_Gvsp_Mono10_Packed,
-        PixelType_Gvsp_Mono12,
-        PixelType_Gvsp_Mono12_Packed,
-        PixelType_Gvsp_Mono16,
-    ]
-    return pixel_type in mono_formats
+    return pixel_type in _MONO_FORMATS
 
 
 def is_rgb_format(pixel_type: int) -> bool:
     """判断是否为 RGB 格式"""
-    return pixel_type in (PixelType_Gvsp_RGB8_Packed, PixelType_Gvsp_BGR8_Packed,
-                          PixelType_Gvsp_RGBA8_Packed, PixelType_Gvsp_BGRA8_Packed)
+    return pixel_type in _RGB_FORMATS